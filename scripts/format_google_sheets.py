@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Format Google Sheets for optimal viewing and usability."""
 
+import logging
 import sys
 import time
 from pathlib import Path
@@ -12,101 +13,129 @@ import gspread
 from google.oauth2.service_account import Credentials
 from gspread.exceptions import SpreadsheetNotFound, APIError
 from content_pipeline.config import PipelineConfig
+from content_pipeline.sheets.formatting import SheetFormatter
 
-def apply_sheet_formatting(worksheet, sheet_type='articles'):
-    """Apply comprehensive formatting to a worksheet."""
+logger = logging.getLogger(__name__)
+
+# (title substring, sheet type) pairs, checked in order against lowercased titles
+SHEET_TYPES = (
+    ('articles', 'articles'),
+    ('ideas', 'ideas'),
+    ('content', 'ideas'),
+)
+
+
+def detect_sheet_type(title):
+    """Return the formatting sheet type for a worksheet title."""
+    title = title.lower()
+    return next((sheet_type for key, sheet_type in SHEET_TYPES if key in title), 'summary')
+
+
+def batch_update_with_retry(spreadsheet, body, max_attempts=5):
+    """Run spreadsheet.batch_update, backing off exponentially on HTTP 429."""
+    for attempt in range(max_attempts):
+        try:
+            return spreadsheet.batch_update(body)
+        except APIError as e:
+            if e.response.status_code != 429 or attempt == max_attempts - 1:
+                raise
+            wait = 2 ** attempt
+            logger.info(f"⏳ Rate limited, retrying in {wait}s...")
+            time.sleep(wait)
+
+
+def fetch_current_format(spreadsheet):
+    """Fetch frozen rows and column widths for every sheet in one call.
+    
+    Returns:
+        Dict mapping sheetId to {'frozen_rows': int, 'widths': [int, ...]};
+        empty if the metadata could not be fetched.
+    """
+    try:
+        metadata = spreadsheet.fetch_sheet_metadata(params={
+            'fields': 'sheets(properties(sheetId,gridProperties/frozenRowCount),'
+                      'data/columnMetadata/pixelSize)'
+        })
+    except Exception as e:
+        logger.warning(f"⚠️ Could not fetch current formatting, formatting everything: {e}")
+        return {}
+    
+    current = {}
+    for sheet in metadata.get('sheets', []):
+        properties = sheet.get('properties', {})
+        column_metadata = (sheet.get('data') or [{}])[0].get('columnMetadata', [])
+        current[properties.get('sheetId')] = {
+            'frozen_rows': properties.get('gridProperties', {}).get('frozenRowCount', 0),
+            'widths': [column.get('pixelSize') for column in column_metadata]
+        }
+    return current
+
+
+def apply_sheet_formatting(worksheet, requests, sheet_type='articles', current_format=None):
+    """Append comprehensive formatting requests for a worksheet to ``requests``.
     
-    print(f"  Formatting {worksheet.title}...")
+    Nothing is sent to the API here; the caller executes all collected
+    requests in a single spreadsheet-level batch_update. When
+    ``current_format`` (from fetch_current_format) is given, the frozen row
+    and column width requests that would not change anything are skipped.
+    """
+    
+    logger.info(f"  Formatting {worksheet.title}...")
     
     try:
         # Get the dimensions
         rows = worksheet.row_count
         cols = worksheet.col_count
         
-        # Define column widths based on sheet type
-        if sheet_type == 'articles':
-            # Articles sheet column widths (17 columns)
-            column_widths = [
-                ('A', 100),   # ID (narrow)
-                ('B', 250),   # URL
-                ('C', 300),   # Title
-                ('D', 350),   # Description
-                ('E', 400),   # Content (widest)
-                ('F', 150),   # Author
-                ('G', 120),   # Published Date
-                ('H', 120),   # Source Feed
-                ('I', 120),   # Scraping Strategy
-                ('J', 100),   # Scraping Success
-                ('K', 120),   # Created At
-                ('L', 120),   # Updated At
-                ('M', 80),    # Word Count
-                ('N', 100),   # Extraction Confidence
-                ('O', 200),   # Failure Reason
-                ('P', 200),   # Keywords
-                ('Q', 200),   # Categories
-            ]
-        elif sheet_type == 'ideas':
-            # Content Ideas sheet column widths
-            column_widths = [
-                ('A', 100),   # ID
-                ('B', 300),   # Title
-                ('C', 400),   # Description
-                ('D', 150),   # Type
-                ('E', 100),   # Priority
-                ('F', 200),   # Target Audience
-                ('G', 200),   # Keywords
-                ('H', 300),   # Source Articles
-                ('I', 120),   # Status
-                ('J', 150),   # Assigned To
-                ('K', 120),   # Created At
-                ('L', 120),   # Updated At
-                ('M', 300),   # Notes
-            ]
-        else:
-            # Summary sheet or default
-            column_widths = [
-                ('A', 200),
-                ('B', 300),
-                ('C', 150),
-                ('D', 150),
-            ]
+        current = (current_format or {}).get(worksheet.id, {})
+        current_widths = current.get('widths', [])
         
-        # Batch update requests
-        requests = []
+        # Collect this sheet's requests locally so a failure skips only this sheet
+        sheet_requests = []
         
         # 1. Freeze the first row (headers)
-        requests.append({
-            'updateSheetProperties': {
-                'properties': {
-                    'sheetId': worksheet.id,
-                    'gridProperties': {
-                        'frozenRowCount': 1
-                    }
-                },
-                'fields': 'gridProperties.frozenRowCount'
-            }
-        })
-        
-        # 2. Set column widths
-        for col_letter, width in column_widths[:cols]:
-            col_index = ord(col_letter) - ord('A')
-            requests.append({
-                'updateDimensionProperties': {
-                    'range': {
-                        'sheetId': worksheet.id,
-                        'dimension': 'COLUMNS',
-                        'startIndex': col_index,
-                        'endIndex': col_index + 1
-                    },
+        if current.get('frozen_rows') != 1:
+            sheet_requests.append({
+                'updateSheetProperties': {
                     'properties': {
-                        'pixelSize': width
+                        'sheetId': worksheet.id,
+                        'gridProperties': {
+                            'frozenRowCount': 1
+                        }
                     },
-                    'fields': 'pixelSize'
+                    'fields': 'gridProperties.frozenRowCount'
                 }
             })
         
+        # 2. Set column widths - one request per run of adjacent columns
+        #    sharing the same width (columns are listed A, B, C, ... in order)
+        widths = SheetFormatter.COLUMN_WIDTHS.get(
+            sheet_type, SheetFormatter.COLUMN_WIDTHS['summary']
+        )[:cols]
+        start = 0
+        for end in range(1, len(widths) + 1):
+            if end < len(widths) and widths[end] == widths[start]:
+                continue
+            # Skip runs that already have the desired width
+            if current_widths[start:end] != widths[start:end]:
+                sheet_requests.append({
+                    'updateDimensionProperties': {
+                        'range': {
+                            'sheetId': worksheet.id,
+                            'dimension': 'COLUMNS',
+                            'startIndex': start,
+                            'endIndex': end
+                        },
+                        'properties': {
+                            'pixelSize': widths[start]
+                        },
+                        'fields': 'pixelSize'
+                    }
+                })
+            start = end
+        
         # 3. Set row height (comfortable for laptop screens)
-        requests.append({
+        sheet_requests.append({
             'updateDimensionProperties': {
                 'range': {
                     'sheetId': worksheet.id,
@@ -122,7 +151,7 @@ def apply_sheet_formatting(worksheet, sheet_type='articles'):
         })
         
         # 4. Format header row (bold, centered, background color)
-        requests.append({
+        sheet_requests.append({
             'repeatCell': {
                 'range': {
                     'sheetId': worksheet.id,
@@ -156,7 +185,7 @@ def apply_sheet_formatting(worksheet, sheet_type='articles'):
         })
         
         # 5. Format data cells (top-aligned, wrap text)
-        requests.append({
+        sheet_requests.append({
             'repeatCell': {
                 'range': {
                     'sheetId': worksheet.id,
@@ -179,7 +208,7 @@ def apply_sheet_formatting(worksheet, sheet_type='articles'):
         })
         
         # 6. Add borders to all cells
-        requests.append({
+        sheet_requests.append({
             'updateBorders': {
                 'range': {
                     'sheetId': worksheet.id,
@@ -197,27 +226,12 @@ def apply_sheet_formatting(worksheet, sheet_type='articles'):
             }
         })
         
-        # 7. Add filter to the data range
-        if rows > 1:  # Only add filter if there's data
-            requests.append({
-                'setBasicFilter': {
-                    'filter': {
-                        'range': {
-                            'sheetId': worksheet.id,
-                            'startRowIndex': 0,
-                            'endRowIndex': rows,
-                            'startColumnIndex': 0,
-                            'endColumnIndex': cols
-                        }
-                    }
-                }
-            })
-        
-        # 8. Special formatting for specific columns
+        # 7. Special formatting for specific columns
+        #    (the basic filter is queued separately by update_filter_range)
         if sheet_type == 'articles':
             # Format confidence column as percentage
             confidence_col = 13  # Column N (0-indexed)
-            requests.append({
+            sheet_requests.append({
                 'repeatCell': {
                     'range': {
                         'sheetId': worksheet.id,
@@ -240,7 +254,7 @@ def apply_sheet_formatting(worksheet, sheet_type='articles'):
             
             # Format word count column as number
             word_count_col = 12  # Column M (0-indexed)
-            requests.append({
+            sheet_requests.append({
                 'repeatCell': {
                     'range': {
                         'sheetId': worksheet.id,
@@ -264,7 +278,7 @@ def apply_sheet_formatting(worksheet, sheet_type='articles'):
             
             # Center align success column
             success_col = 9  # Column J (0-indexed)
-            requests.append({
+            sheet_requests.append({
                 'repeatCell': {
                     'range': {
                         'sheetId': worksheet.id,
@@ -282,27 +296,25 @@ def apply_sheet_formatting(worksheet, sheet_type='articles'):
                 }
             })
         
-        # Execute batch update
-        worksheet.spreadsheet.batch_update({'requests': requests})
-        print(f"    ✅ Applied formatting to {worksheet.title}")
+        requests.extend(sheet_requests)
+        logger.info(f"    ✅ Queued formatting for {worksheet.title}")
         
     except Exception as e:
-        print(f"    ⚠️ Error formatting {worksheet.title}: {e}")
+        logger.warning(f"    ⚠️ Error formatting {worksheet.title}: {e}")
 
 
-def update_filter_range(worksheet):
-    """Update filter to include all data rows."""
+def update_filter_range(worksheet, requests):
+    """Append a request updating the filter to include all data rows."""
     try:
-        # Get current data range
-        all_values = worksheet.get_all_values()
-        if len(all_values) <= 1:
+        # Grid dimensions come from the metadata fetched on open, so there's
+        # no need to download every cell value just to size the filter
+        rows = worksheet.row_count
+        cols = worksheet.col_count
+        if rows <= 1:
             return  # No data to filter
-        
-        rows = len(all_values)
-        cols = len(all_values[0]) if all_values else 0
-        
+
         # Update filter range
-        request = {
+        requests.append({
             'setBasicFilter': {
                 'filter': {
                     'range': {
@@ -314,20 +326,18 @@ def update_filter_range(worksheet):
                     }
                 }
             }
-        }
-        
-        worksheet.spreadsheet.batch_update({'requests': [request]})
-        print(f"    ✅ Updated filter range for {worksheet.title}")
+        })
+        logger.info(f"    ✅ Queued filter range update for {worksheet.title}")
         
     except Exception as e:
-        print(f"    ⚠️ Could not update filter for {worksheet.title}: {e}")
+        logger.warning(f"    ⚠️ Could not update filter for {worksheet.title}: {e}")
 
 
 def main():
     """Apply formatting to all sheets in the Google Sheets document."""
     
-    print("🎨 Google Sheets Formatter")
-    print("=" * 60)
+    logger.info("🎨 Google Sheets Formatter")
+    logger.info("=" * 60)
     
     # Load configuration
     config = PipelineConfig()
@@ -337,19 +347,19 @@ def main():
     spreadsheet_id = config.get_google_sheets_spreadsheet_id()
     
     if not credentials_path:
-        print("❌ GOOGLE_SHEETS_CREDENTIALS_PATH not set")
+        logger.error("❌ GOOGLE_SHEETS_CREDENTIALS_PATH not set")
         return False
     
     if not spreadsheet_id:
-        print("❌ GOOGLE_SHEETS_SPREADSHEET_ID not set")
+        logger.error("❌ GOOGLE_SHEETS_SPREADSHEET_ID not set")
         return False
     
     credentials_path = Path(credentials_path)
     if not credentials_path.exists():
-        print(f"❌ Credentials file not found: {credentials_path}")
+        logger.error(f"❌ Credentials file not found: {credentials_path}")
         return False
     
-    print(f"📊 Spreadsheet ID: {spreadsheet_id}")
+    logger.info(f"📊 Spreadsheet ID: {spreadsheet_id}")
     
     try:
         # Initialize Google Sheets client
@@ -366,64 +376,62 @@ def main():
         client = gspread.authorize(credentials)
         spreadsheet = client.open_by_key(spreadsheet_id)
         
-        print(f"✅ Connected to: {spreadsheet.title}\n")
+        logger.info(f"✅ Connected to: {spreadsheet.title}\n")
         
         # Process each worksheet
         worksheets = spreadsheet.worksheets()
-        print(f"Found {len(worksheets)} sheets to format:\n")
+        logger.info(f"Found {len(worksheets)} sheets to format:\n")
+        
+        # Collect requests for every sheet and send them in one batch_update
+        all_requests = []
+        current_format = fetch_current_format(spreadsheet)
         
         for worksheet in worksheets:
-            print(f"Processing: {worksheet.title}")
-            
-            # Determine sheet type
-            if 'articles' in worksheet.title.lower():
-                sheet_type = 'articles'
-            elif 'ideas' in worksheet.title.lower() or 'content' in worksheet.title.lower():
-                sheet_type = 'ideas'
-            else:
-                sheet_type = 'summary'
+            logger.info(f"Processing: {worksheet.title}")
             
-            # Apply formatting
-            apply_sheet_formatting(worksheet, sheet_type)
+            sheet_type = detect_sheet_type(worksheet.title)
             
-            # Update filter range to include all data
-            update_filter_range(worksheet)
+            # Queue formatting
+            apply_sheet_formatting(worksheet, all_requests, sheet_type, current_format)
             
-            print()
+            # Queue filter range update to include all data
+            update_filter_range(worksheet, all_requests)
             
-            # Rate limit to avoid API quota issues
-            time.sleep(2)
+            logger.info("")
+        
+        if all_requests:
+            logger.info(f"Sending {len(all_requests)} formatting requests in a single batch...")
+            batch_update_with_retry(spreadsheet, {'requests': all_requests})
         
-        print("=" * 60)
-        print("✅ Formatting complete!")
-        print("\nFormatting Applied:")
-        print("  • First row frozen as headers")
-        print("  • Column widths optimized for laptop screens")
-        print("  • Text wrapping enabled")
-        print("  • Cells aligned to top")
-        print("  • Filters applied to all data")
-        print("  • Headers styled with background color")
-        print("  • Borders added for clarity")
-        print("  • Special formatting for numeric columns")
+        logger.info("=" * 60)
+        logger.info("✅ Formatting complete!")
+        logger.info("\nFormatting Applied:")
+        logger.info("  • First row frozen as headers")
+        logger.info("  • Column widths optimized for laptop screens")
+        logger.info("  • Text wrapping enabled")
+        logger.info("  • Cells aligned to top")
+        logger.info("  • Filters applied to all data")
+        logger.info("  • Headers styled with background color")
+        logger.info("  • Borders added for clarity")
+        logger.info("  • Special formatting for numeric columns")
         
         return True
         
     except SpreadsheetNotFound:
-        print(f"❌ Spreadsheet not found: {spreadsheet_id}")
-        print("Make sure you have access to the spreadsheet.")
+        logger.error(f"❌ Spreadsheet not found: {spreadsheet_id}")
+        logger.info("Make sure you have access to the spreadsheet.")
         return False
         
     except APIError as e:
-        print(f"❌ Google Sheets API error: {e}")
+        logger.error(f"❌ Google Sheets API error: {e}")
         return False
         
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ Unexpected error: {e}")
         return False
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -5,6 +5,7 @@ Adds extraction_confidence and failure_reason columns to existing Articles sheet
 Preserves all existing data while migrating to the new schema.
 """
 
+import logging
 import sys
 import time
 from pathlib import Path
@@ -17,6 +18,8 @@ from src.content_pipeline.config import PipelineConfig
 from src.content_pipeline.sheets.google_sheets import GoogleSheetsManager
 from src.content_pipeline.core.models import Article
 
+logger = logging.getLogger(__name__)
+
 
 class SheetsMigration:
     """Handles migration of Google Sheets to new schema."""
@@ -29,6 +32,9 @@ class SheetsMigration:
             spreadsheet_id=config.spreadsheet_id
         )
         self.backup_data = {}
+        
+        # Target schema, computed once and shared by migrate/verify/dry-run
+        self._expected_headers = Article.sheet_headers()
     
     def backup_sheet(self, sheet_name: str) -> bool:
         """
@@ -50,14 +56,14 @@ class SheetsMigration:
                     'rows': all_data[1:] if len(all_data) > 1 else [],
                     'row_count': len(all_data) - 1
                 }
-                print(f"  ✓ Backed up {len(all_data) - 1} rows from {sheet_name}")
+                logger.info(f"  ✓ Backed up {len(all_data) - 1} rows from {sheet_name}")
                 return True
             else:
-                print(f"  ⚠️  No data to backup in {sheet_name}")
+                logger.warning(f"  ⚠️  No data to backup in {sheet_name}")
                 return True
                 
         except Exception as e:
-            print(f"  ✗ Error backing up {sheet_name}: {e}")
+            logger.error(f"  ✗ Error backing up {sheet_name}: {e}")
             return False
     
     def migrate_articles_sheet(self) -> bool:
@@ -75,91 +81,103 @@ class SheetsMigration:
             
             # Get current headers
             current_headers = worksheet.row_values(1)
-            expected_headers = Article.sheet_headers()
+            expected_headers = self._expected_headers
             
             # Check if migration is needed
             if current_headers == expected_headers:
-                print(f"  ✓ {sheet_name} sheet already has the correct schema")
+                logger.info(f"  ✓ {sheet_name} sheet already has the correct schema")
                 return True
             
             # Identify what needs to be migrated
             missing_columns = set(expected_headers) - set(current_headers)
             
             if missing_columns != {"Extraction Confidence", "Failure Reason"}:
-                print(f"  ⚠️  Unexpected schema difference. Missing columns: {missing_columns}")
+                logger.warning(f"  ⚠️  Unexpected schema difference. Missing columns: {missing_columns}")
                 response = input("  Continue with migration? (y/n): ")
                 if response.lower() != 'y':
-                    print("  Migration cancelled")
+                    logger.info("  Migration cancelled")
                     return False
             
             # Backup current data
-            print(f"\n📦 Backing up {sheet_name} sheet...")
+            logger.info(f"\n📦 Backing up {sheet_name} sheet...")
             if not self.backup_sheet(sheet_name):
-                print("  ✗ Backup failed, aborting migration")
+                logger.error("  ✗ Backup failed, aborting migration")
                 return False
             
-            backup = self.backup_data[sheet_name]
-            
-            # Prepare migrated data
-            print(f"\n🔄 Migrating {sheet_name} sheet...")
-            
-            # Create new rows with migrated data
-            migrated_rows = []
+            backup = self.backup_data.get(sheet_name, {})
             
-            # Add new headers
-            migrated_rows.append(expected_headers)
+            # Migrate in place: insert the new columns server-side instead of
+            # clearing the sheet and re-uploading every row
+            logger.info(f"\n🔄 Migrating {sheet_name} sheet...")
             
-            # Find indices for insertion
             # New columns go after "Word Count" and before "Keywords"
-            word_count_idx = current_headers.index("Word Count") if "Word Count" in current_headers else 12
-            
-            # Process each data row
-            for row in backup['rows']:
-                # Ensure row has enough columns
-                while len(row) < len(current_headers):
-                    row.append("")
-                
-                # Insert new columns with default values
-                new_row = row[:word_count_idx + 1]  # Everything up to and including Word Count
-                new_row.append("0.00")  # Extraction Confidence default
-                new_row.append("")  # Failure Reason default
-                new_row.extend(row[word_count_idx + 1:])  # Keywords, Categories
-                
-                # Ensure row has correct number of columns
-                while len(new_row) < len(expected_headers):
-                    new_row.append("")
-                
-                migrated_rows.append(new_row[:len(expected_headers)])  # Trim if too long
+            header_idx = {h: i for i, h in enumerate(current_headers)}
+            word_count_idx = header_idx.get("Word Count", 12)
+            insert_idx = word_count_idx + 1
+            data_rows = backup.get('row_count', 0)
             
-            # Clear sheet and write migrated data
-            print(f"  📝 Writing migrated data...")
-            worksheet.clear()
+            requests = [
+                # Blank columns for Extraction Confidence and Failure Reason
+                {
+                    'insertDimension': {
+                        'range': {
+                            'sheetId': worksheet.id,
+                            'dimension': 'COLUMNS',
+                            'startIndex': insert_idx,
+                            'endIndex': insert_idx + 2
+                        },
+                        'inheritFromBefore': True
+                    }
+                },
+                # Rewrite the header row with the expected schema
+                {
+                    'updateCells': {
+                        'start': {'sheetId': worksheet.id, 'rowIndex': 0, 'columnIndex': 0},
+                        'rows': [{
+                            'values': [{'userEnteredValue': {'stringValue': h}} for h in expected_headers]
+                        }],
+                        'fields': 'userEnteredValue'
+                    }
+                }
+            ]
             
-            # Write all rows at once for efficiency
-            if migrated_rows:
-                update_range = f"A1:{chr(64 + len(expected_headers))}{len(migrated_rows)}"
-                worksheet.update(update_range, migrated_rows, value_input_option='USER_ENTERED')
-                
-                # Format headers
-                worksheet.format('1:1', {
-                    'backgroundColor': {'red': 0.8, 'green': 0.8, 'blue': 0.8},
-                    'textFormat': {'bold': True}
+            if data_rows > 0:
+                # Default Extraction Confidence to 0.00 for existing rows
+                requests.append({
+                    'repeatCell': {
+                        'range': {
+                            'sheetId': worksheet.id,
+                            'startRowIndex': 1,
+                            'endRowIndex': data_rows + 1,
+                            'startColumnIndex': insert_idx,
+                            'endColumnIndex': insert_idx + 1
+                        },
+                        'cell': {
+                            'userEnteredValue': {'numberValue': 0},
+                            'userEnteredFormat': {
+                                'numberFormat': {'type': 'NUMBER', 'pattern': '0.00'}
+                            }
+                        },
+                        'fields': 'userEnteredValue,userEnteredFormat.numberFormat'
+                    }
                 })
-                
-                print(f"  ✓ Migrated {len(migrated_rows) - 1} rows successfully")
             
-            # Auto-resize columns
-            try:
-                worksheet.columns_auto_resize(0, len(expected_headers) - 1)
-            except:
-                pass  # Auto-resize might not be available
+            logger.info(f"  📝 Inserting new columns...")
+            worksheet.spreadsheet.batch_update({'requests': requests})
+            logger.info(f"  ✓ Migrated {data_rows} rows successfully")
+            
+            # The row copy is only needed to recover from a failed migration;
+            # keep headers and row_count for verification and drop the rest
+            backup.pop('rows', None)
+            
+            # Column widths are handled by scripts/format_google_sheets.py
             
             return True
             
         except Exception as e:
-            print(f"  ✗ Error migrating {sheet_name}: {e}")
-            print(f"\n  ⚠️  Migration failed. Data backup is available in memory.")
-            print(f"     Consider running the purge script and re-importing data if needed.")
+            logger.error(f"  ✗ Error migrating {sheet_name}: {e}")
+            logger.warning(f"\n  ⚠️  Migration failed. Data backup is available in memory.")
+            logger.info(f"     Consider running the purge script and re-importing data if needed.")
             return False
     
     def verify_migration(self) -> bool:
@@ -169,50 +187,54 @@ class SheetsMigration:
         Returns:
             True if verification passes, False otherwise
         """
-        print("\n🔍 Verifying migration...")
+        logger.info("\n🔍 Verifying migration...")
         
         try:
-            worksheet = self.sheets_manager.spreadsheet.worksheet("Articles")
-            current_headers = worksheet.row_values(1)
-            expected_headers = Article.sheet_headers()
+            # Headers, first data row and the ID column in a single round-trip
+            response = self.sheets_manager.spreadsheet.values_batch_get(
+                ["Articles!1:1", "Articles!2:2", "Articles!A2:A"]
+            )
+            header_range, sample_range, id_range = response.get("valueRanges", [{}, {}, {}])
+            current_headers = (header_range.get("values") or [[]])[0]
+            sample_row = (sample_range.get("values") or [[]])[0]
+            expected_headers = self._expected_headers
             
             if current_headers == expected_headers:
-                print(f"  ✓ Headers match expected schema")
+                logger.info(f"  ✓ Headers match expected schema")
                 
                 # Check row count matches
-                all_values = worksheet.get_all_values()
-                current_rows = len(all_values) - 1
+                current_rows = len(id_range.get("values", []))
                 original_rows = self.backup_data.get("Articles", {}).get("row_count", 0)
                 
                 if current_rows == original_rows:
-                    print(f"  ✓ Row count preserved: {current_rows} rows")
+                    logger.info(f"  ✓ Row count preserved: {current_rows} rows")
                 else:
-                    print(f"  ⚠️  Row count mismatch: {original_rows} → {current_rows}")
+                    logger.warning(f"  ⚠️  Row count mismatch: {original_rows} → {current_rows}")
                 
                 # Sample a few rows to verify data integrity
                 if current_rows > 0:
-                    sample_row = worksheet.row_values(2)  # First data row
                     if len(sample_row) >= len(expected_headers):
-                        print(f"  ✓ Data structure looks correct")
+                        logger.info(f"  ✓ Data structure looks correct")
                         
                         # Check new columns have default values
-                        extraction_conf_idx = expected_headers.index("Extraction Confidence")
-                        failure_reason_idx = expected_headers.index("Failure Reason")
+                        header_idx = {h: i for i, h in enumerate(expected_headers)}
+                        extraction_conf_idx = header_idx["Extraction Confidence"]
+                        failure_reason_idx = header_idx["Failure Reason"]
                         
                         if sample_row[extraction_conf_idx] == "0.00":
-                            print(f"  ✓ Extraction Confidence initialized correctly")
+                            logger.info(f"  ✓ Extraction Confidence initialized correctly")
                         if sample_row[failure_reason_idx] == "":
-                            print(f"  ✓ Failure Reason initialized correctly")
+                            logger.info(f"  ✓ Failure Reason initialized correctly")
                     else:
-                        print(f"  ⚠️  Row has fewer columns than expected")
+                        logger.warning(f"  ⚠️  Row has fewer columns than expected")
                 
                 return True
             else:
-                print(f"  ✗ Headers don't match expected schema")
+                logger.error(f"  ✗ Headers don't match expected schema")
                 return False
                 
         except Exception as e:
-            print(f"  ✗ Error verifying migration: {e}")
+            logger.error(f"  ✗ Error verifying migration: {e}")
             return False
     
     def run(self) -> bool:
@@ -222,47 +244,47 @@ class SheetsMigration:
         Returns:
             True if migration successful, False otherwise
         """
-        print("=" * 60)
-        print("GOOGLE SHEETS SCHEMA MIGRATION")
-        print("=" * 60)
-        print("\nThis script will migrate your Google Sheets to include:")
-        print("  • extraction_confidence field (confidence score 0.0-1.0)")
-        print("  • failure_reason field (detailed error messages)")
-        print("\n⚠️  IMPORTANT: This will modify your production Google Sheets!")
+        logger.info("=" * 60)
+        logger.info("GOOGLE SHEETS SCHEMA MIGRATION")
+        logger.info("=" * 60)
+        logger.info("\nThis script will migrate your Google Sheets to include:")
+        logger.info("  • extraction_confidence field (confidence score 0.0-1.0)")
+        logger.info("  • failure_reason field (detailed error messages)")
+        logger.warning("\n⚠️  IMPORTANT: This will modify your production Google Sheets!")
         
         # Test connection
-        print("\n🔌 Testing connection...")
+        logger.info("\n🔌 Testing connection...")
         if not self.sheets_manager.test_connection():
-            print("✗ Failed to connect to Google Sheets")
+            logger.error("✗ Failed to connect to Google Sheets")
             return False
         
-        print("✓ Connected successfully")
-        print(f"  Sheet URL: {self.sheets_manager.spreadsheet.url}")
+        logger.info("✓ Connected successfully")
+        logger.info(f"  Sheet URL: {self.sheets_manager.spreadsheet.url}")
         
         # Confirm before proceeding
         response = input("\n⚠️  Proceed with migration? (yes/no): ")
         if response.lower() not in ['yes', 'y']:
-            print("Migration cancelled")
+            logger.info("Migration cancelled")
             return False
         
         # Run migration
         if self.migrate_articles_sheet():
             # Verify migration
             if self.verify_migration():
-                print("\n" + "=" * 60)
-                print("✓ MIGRATION COMPLETED SUCCESSFULLY")
-                print("=" * 60)
-                print("\nNext steps:")
-                print("  1. Run a test with a small batch of articles")
-                print("  2. Verify data is being saved correctly")
-                print("  3. Monitor for any issues")
+                logger.info("\n" + "=" * 60)
+                logger.info("✓ MIGRATION COMPLETED SUCCESSFULLY")
+                logger.info("=" * 60)
+                logger.info("\nNext steps:")
+                logger.info("  1. Run a test with a small batch of articles")
+                logger.info("  2. Verify data is being saved correctly")
+                logger.info("  3. Monitor for any issues")
                 return True
             else:
-                print("\n⚠️  Migration verification failed")
-                print("Please check the Google Sheets manually")
+                logger.warning("\n⚠️  Migration verification failed")
+                logger.info("Please check the Google Sheets manually")
                 return False
         else:
-            print("\n✗ Migration failed")
+            logger.error("\n✗ Migration failed")
             return False
 
 
@@ -277,6 +299,9 @@ def main():
                        help="Preview migration without making changes")
     args = parser.parse_args()
     
+    # Plain messages on stdout so output stays in order with the input() prompts
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
     migration = SheetsMigration()
     
     # Override the run method for auto-confirm
@@ -284,51 +309,54 @@ def main():
         original_run = migration.run
         
         def auto_run():
-            print("=" * 60)
-            print("GOOGLE SHEETS SCHEMA MIGRATION")
-            print("=" * 60)
-            print("\nThis script will migrate your Google Sheets to include:")
-            print("  • extraction_confidence field (confidence score 0.0-1.0)")
-            print("  • failure_reason field (detailed error messages)")
+            logger.info("=" * 60)
+            logger.info("GOOGLE SHEETS SCHEMA MIGRATION")
+            logger.info("=" * 60)
+            logger.info("\nThis script will migrate your Google Sheets to include:")
+            logger.info("  • extraction_confidence field (confidence score 0.0-1.0)")
+            logger.info("  • failure_reason field (detailed error messages)")
             
             if args.dry_run:
-                print("\n🔍 DRY RUN MODE - No changes will be made")
+                logger.info("\n🔍 DRY RUN MODE - No changes will be made")
             
-            print("\n🔌 Testing connection...")
+            logger.info("\n🔌 Testing connection...")
             if not migration.sheets_manager.test_connection():
-                print("✗ Failed to connect to Google Sheets")
+                logger.error("✗ Failed to connect to Google Sheets")
                 return False
             
-            print("✓ Connected successfully")
-            print(f"  Sheet URL: {migration.sheets_manager.spreadsheet.url}")
+            logger.info("✓ Connected successfully")
+            logger.info(f"  Sheet URL: {migration.sheets_manager.spreadsheet.url}")
             
             if args.dry_run:
-                print("\n📋 Would migrate Articles sheet:")
-                worksheet = migration.sheets_manager.spreadsheet.worksheet("Articles")
-                current_headers = worksheet.row_values(1)
-                expected_headers = Article.sheet_headers()
+                logger.info("\n📋 Would migrate Articles sheet:")
+                response = migration.sheets_manager.spreadsheet.values_batch_get(
+                    ["Articles!1:1", "Articles!A2:A"]
+                )
+                header_range, id_range = response.get("valueRanges", [{}, {}])
+                current_headers = (header_range.get("values") or [[]])[0]
+                expected_headers = migration._expected_headers
                 
                 if current_headers == expected_headers:
-                    print("  ✓ Sheet already has correct schema - no migration needed")
+                    logger.info("  ✓ Sheet already has correct schema - no migration needed")
                 else:
                     missing = set(expected_headers) - set(current_headers)
-                    print(f"  Would add columns: {list(missing)}")
-                    print(f"  Would preserve {len(worksheet.get_all_values()) - 1} existing rows")
+                    logger.info(f"  Would add columns: {list(missing)}")
+                    logger.info(f"  Would preserve {len(id_range.get('values', []))} existing rows")
                 return True
             
-            print("\n⚠️  Auto-confirm mode - proceeding with migration...")
+            logger.warning("\n⚠️  Auto-confirm mode - proceeding with migration...")
             
             if migration.migrate_articles_sheet():
                 if migration.verify_migration():
-                    print("\n" + "=" * 60)
-                    print("✓ MIGRATION COMPLETED SUCCESSFULLY")
-                    print("=" * 60)
+                    logger.info("\n" + "=" * 60)
+                    logger.info("✓ MIGRATION COMPLETED SUCCESSFULLY")
+                    logger.info("=" * 60)
                     return True
                 else:
-                    print("\n⚠️  Migration verification failed")
+                    logger.warning("\n⚠️  Migration verification failed")
                     return False
             else:
-                print("\n✗ Migration failed")
+                logger.error("\n✗ Migration failed")
                 return False
         
         migration.run = auto_run
@@ -14,11 +14,22 @@ Usage:
 
 import argparse
 import json
+import random
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+from gspread.exceptions import APIError
+from gspread.utils import absolute_range_name, rowcol_to_a1
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 # Add parent directory to path to import our modules
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -30,10 +41,68 @@ from src.content_pipeline.core.models import (
 )
 from src.content_pipeline.sheets.google_sheets import GoogleSheetsManager
 
+def _dumps_row(row: List[Any]) -> bytes:
+    """Serialize one sheet row to UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(row)
+    return json.dumps(row, ensure_ascii=False).encode('utf-8')
+
+
+# Lookup tables for migrating old rows, built once rather than per row
+_FEED_LOOKUP = {feed.value.lower(): feed for feed in SourceFeed}
+# Old content type labels are matched by substring, in this order
+_TYPE_LOOKUP = (
+    ("blog post", ContentType.BLOG_POST),
+    ("video script", ContentType.VIDEO),
+    ("social media post", ContentType.SOCIAL_MEDIA),
+    ("podcast", ContentType.PODCAST),
+    ("infographic", ContentType.INFOGRAPHIC),
+)
+
+# HTTP statuses from the Sheets API that are worth retrying
+RETRYABLE_STATUS_CODES = (429, 500, 503)
+
+
+def _retry(fn, *args, max_attempts: int = 6, **kwargs):
+    """Call a Sheets API function, backing off exponentially on transient errors.
+    
+    Rate limits and server errors are retried with jittered exponential
+    backoff (honouring Retry-After when the API sends one) so a transient
+    failure doesn't abort the whole purge.
+    
+    Args:
+        fn: Callable performing the API request
+        *args: Positional arguments for fn
+        max_attempts: Maximum number of attempts before re-raising
+        **kwargs: Keyword arguments for fn
+        
+    Returns:
+        Whatever fn returns
+    """
+    for attempt in range(max_attempts):
+        try:
+            return fn(*args, **kwargs)
+        except APIError as e:
+            status = e.response.status_code
+            if status not in RETRYABLE_STATUS_CODES or attempt == max_attempts - 1:
+                raise
+            retry_after = e.response.headers.get("Retry-After")
+            wait = float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt + random.random()
+            print(f"  ⏳ Sheets API returned {status}, retrying in {wait:.1f}s...")
+            time.sleep(wait)
+
 
 class SheetsPurgeManager:
     """Manages the purging and migration of Google Sheets data."""
     
+    # Rows per write request when writing migrated data; keeps each request
+    # well below the Sheets API payload limit for sheets with long content
+    WRITE_CHUNK_SIZE = 1000
+    
+    # Concurrent reads when sheets have to be backed up one by one; kept
+    # small to stay well inside the Sheets read quota
+    BACKUP_WORKERS = 4
+    
     def __init__(self):
         """Initialize the purge manager."""
         config = PipelineConfig()
@@ -48,128 +117,231 @@ class SheetsPurgeManager:
         
         print(f"Initialized purge manager. Backups will be saved to: {self.backup_dir}")
     
-    def backup_sheet(self, sheet_name: str) -> Optional[List[List[Any]]]:
+    def _write_backup(self, sheet_name: str, data: List[List[Any]]) -> Optional[Path]:
+        """Write already-fetched sheet data to its JSON backup file.
+        
+        Rows are serialized and written one at a time, so the full JSON
+        document is never built in memory alongside the sheet data.
+        
+        Args:
+            sheet_name: Name of the sheet the data came from
+            data: Sheet rows
+            
+        Returns:
+            Path to the backup file, or None if the sheet is empty
+        """
+        if not data:
+            print(f"  {sheet_name} is empty, skipping backup")
+            return None
+        
+        backup_file = self.backup_dir / f"{sheet_name.replace(' ', '_').lower()}.json"
+        with open(backup_file, 'wb') as f:
+            f.write(b"[\n")
+            for i, row in enumerate(data):
+                if i:
+                    f.write(b",\n")
+                f.write(_dumps_row(row))
+            f.write(b"\n]\n")
+        
+        print(f"✓ Backed up {sheet_name}: {len(data)} rows to {backup_file}")
+        return backup_file
+    
+    def backup_sheet(self, sheet_name: str) -> Optional[Path]:
         """Backup a single sheet to JSON file.
         
         Args:
             sheet_name: Name of the sheet to backup
             
         Returns:
-            The backed up data or None if sheet doesn't exist
+            Path to the backup file, or None if the sheet is empty or doesn't exist
         """
         try:
-            worksheet = self.sheets_manager.spreadsheet.worksheet(sheet_name)
-            data = worksheet.get_all_values()
+            worksheet = _retry(self.sheets_manager.spreadsheet.worksheet, sheet_name)
             
-            if data:
-                # Save to JSON file
-                backup_file = self.backup_dir / f"{sheet_name.replace(' ', '_').lower()}.json"
-                with open(backup_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                
-                print(f"✓ Backed up {sheet_name}: {len(data)} rows to {backup_file}")
-                return data
-            else:
-                print(f"  {sheet_name} is empty, skipping backup")
-                return []
+            # Skip the full-sheet fetch for sheets with nothing below the header.
+            # The grid size comes from cached metadata; otherwise probe the ID
+            # column, which every row written by the pipeline fills in
+            if (worksheet.row_count <= 1 and worksheet.col_count <= 1) or \
+                    len(_retry(worksheet.col_values, 1)) <= 1:
+                print(f"  {sheet_name} has no data rows, skipping backup")
+                return None
+            
+            data = _retry(worksheet.get_all_values)
+            return self._write_backup(sheet_name, data)
                 
         except Exception as e:
             print(f"✗ Failed to backup {sheet_name}: {e}")
             return None
     
-    def backup_all_sheets(self) -> Dict[str, List[List[Any]]]:
+    def backup_all_sheets(self) -> Dict[str, Path]:
         """Backup all sheets to JSON files.
         
+        All sheets are read with a single values.batchGet request. Sheet data
+        is released as soon as it is on disk; use load_backup() to read it back.
+        
         Returns:
-            Dictionary of sheet name to data
+            Dictionary of sheet name to backup file path (empty sheets are omitted)
         """
         print("\n=== BACKING UP EXISTING DATA ===")
         
         backups = {}
         sheets_to_backup = ["Articles", "Content Ideas", "Summary", "Summary Report"]
         
+        try:
+            existing = [ws.title for ws in _retry(self.sheets_manager.spreadsheet.worksheets)]
+        except Exception as e:
+            print(f"✗ Could not enumerate worksheets: {e}")
+            return backups
+        
         for sheet_name in sheets_to_backup:
-            data = self.backup_sheet(sheet_name)
-            if data is not None:
-                backups[sheet_name] = data
+            if sheet_name not in existing:
+                print(f"  {sheet_name} does not exist, skipping backup")
+        
+        # Known sheets first, then any other sheets that might exist
+        titles = [name for name in sheets_to_backup if name in existing]
+        titles += [title for title in existing if title not in sheets_to_backup]
         
-        # Also backup any other sheets that might exist
         try:
-            all_worksheets = self.sheets_manager.spreadsheet.worksheets()
-            for worksheet in all_worksheets:
-                if worksheet.title not in sheets_to_backup and worksheet.title not in backups:
-                    data = self.backup_sheet(worksheet.title)
-                    if data is not None:
-                        backups[worksheet.title] = data
+            sheet_values = _retry(self.sheets_manager.get_sheet_values, titles)
         except Exception as e:
-            print(f"Warning: Could not enumerate all worksheets: {e}")
+            # A single oversized or failing range sinks the whole batchGet, so
+            # fall back to reading the sheets individually, a few at a time
+            print(f"⚠️  Batched read failed ({e}), backing up sheets individually")
+            with ThreadPoolExecutor(max_workers=self.BACKUP_WORKERS) as executor:
+                results = list(executor.map(self.backup_sheet, titles))
+            for sheet_name, backup_file in zip(titles, results):
+                if backup_file is not None:
+                    backups[sheet_name] = backup_file
+            print(f"\nBackup complete. {len(backups)} sheets backed up to {self.backup_dir}")
+            return backups
+        
+        for sheet_name in titles:
+            data = sheet_values.pop(sheet_name, [])
+            try:
+                backup_file = self._write_backup(sheet_name, data)
+                if backup_file is not None:
+                    backups[sheet_name] = backup_file
+            except Exception as e:
+                print(f"✗ Failed to backup {sheet_name}: {e}")
         
         print(f"\nBackup complete. {len(backups)} sheets backed up to {self.backup_dir}")
         return backups
     
-    def clear_sheet(self, sheet_name: str) -> bool:
-        """Clear all data from a sheet.
+    @staticmethod
+    def load_backup(backup_file: Path) -> List[List[Any]]:
+        """Load sheet rows from a JSON backup file.
+        
+        Args:
+            backup_file: Path returned by backup_all_sheets()/backup_sheet()
+            
+        Returns:
+            Sheet rows
+        """
+        if orjson is not None:
+            return orjson.loads(backup_file.read_bytes())
+        with open(backup_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _ensure_worksheets(self, sheet_names: List[str]) -> Dict[str, Any]:
+        """Get worksheet handles for several sheets, creating any that are missing.
+        
+        Existing worksheets are resolved with a single worksheets() call
+        instead of one lookup per sheet.
         
         Args:
-            sheet_name: Name of the sheet to clear
+            sheet_names: Names of the sheets to resolve
+            
+        Returns:
+            Dictionary of sheet name to worksheet
+        """
+        spreadsheet = self.sheets_manager.spreadsheet
+        ws_by_title = {ws.title: ws for ws in _retry(spreadsheet.worksheets)}
+        
+        for sheet_name in sheet_names:
+            if sheet_name not in ws_by_title:
+                ws_by_title[sheet_name] = _retry(spreadsheet.add_worksheet, title=sheet_name, rows=1000, cols=20)
+        
+        return {sheet_name: ws_by_title[sheet_name] for sheet_name in sheet_names}
+    
+    def clear_sheets(self, sheet_names: List[str]) -> bool:
+        """Clear all data from several sheets with a single values.batchClear call.
+        
+        Args:
+            sheet_names: Names of the sheets to clear (missing sheets are created)
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            worksheet = self.sheets_manager._get_or_create_worksheet(sheet_name)
-            worksheet.clear()
-            print(f"✓ Cleared {sheet_name}")
+            self._ensure_worksheets(sheet_names)
+            
+            _retry(
+                self.sheets_manager.spreadsheet.values_batch_clear,
+                body={"ranges": [absolute_range_name(name) for name in sheet_names]}
+            )
+            for sheet_name in sheet_names:
+                print(f"✓ Cleared {sheet_name}")
             return True
         except Exception as e:
-            print(f"✗ Failed to clear {sheet_name}: {e}")
+            print(f"✗ Failed to clear sheets: {e}")
             return False
     
     def setup_standardized_headers(self):
-        """Set up new standardized headers for all sheets."""
+        """Set up new standardized headers for all sheets.
+        
+        Headers for every sheet are written with one values.batchUpdate call
+        and styled with one spreadsheets.batchUpdate call.
+        """
         print("\n=== SETTING UP STANDARDIZED HEADERS ===")
         
-        # Articles sheet
-        try:
-            worksheet = self.sheets_manager._get_or_create_worksheet("Articles")
-            worksheet.clear()
-            headers = Article.sheet_headers()
-            worksheet.append_row(headers)
-            worksheet.format('1:1', {
+        header_specs = [
+            ("Articles", Article.sheet_headers(), {
                 'backgroundColor': {'red': 0.8, 'green': 0.8, 'blue': 0.8},
                 'textFormat': {'bold': True}
-            })
-            print(f"✓ Set up Articles headers ({len(headers)} columns)")
-        except Exception as e:
-            print(f"✗ Failed to set up Articles headers: {e}")
-        
-        # Content Ideas sheet
-        try:
-            worksheet = self.sheets_manager._get_or_create_worksheet("Content Ideas")
-            worksheet.clear()
-            headers = ContentIdea.sheet_headers()
-            worksheet.append_row(headers)
-            worksheet.format('1:1', {
+            }),
+            ("Content Ideas", ContentIdea.sheet_headers(), {
                 'backgroundColor': {'red': 0.8, 'green': 0.9, 'blue': 0.8},
                 'textFormat': {'bold': True}
-            })
-            print(f"✓ Set up Content Ideas headers ({len(headers)} columns)")
-        except Exception as e:
-            print(f"✗ Failed to set up Content Ideas headers: {e}")
-        
-        # Summary Report sheet (new structured format)
-        try:
-            worksheet = self.sheets_manager._get_or_create_worksheet("Summary Report")
-            worksheet.clear()
-            headers = SummaryReport.sheet_headers()
-            worksheet.append_row(headers)
-            worksheet.format('1:1', {
+            }),
+            # Summary Report sheet (new structured format)
+            ("Summary Report", SummaryReport.sheet_headers(), {
                 'backgroundColor': {'red': 0.2, 'green': 0.6, 'blue': 0.9},
                 'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
+            }),
+        ]
+        
+        try:
+            worksheets = self._ensure_worksheets([sheet_name for sheet_name, _, _ in header_specs])
+            
+            _retry(self.sheets_manager.spreadsheet.values_batch_update, body={
+                "valueInputOption": "RAW",
+                "data": [
+                    {"range": absolute_range_name(sheet_name, "A1"), "values": [headers]}
+                    for sheet_name, headers, _ in header_specs
+                ]
+            })
+            
+            _retry(self.sheets_manager.spreadsheet.batch_update, {
+                "requests": [
+                    {
+                        "repeatCell": {
+                            "range": {
+                                "sheetId": worksheets[sheet_name].id,
+                                "startRowIndex": 0,
+                                "endRowIndex": 1
+                            },
+                            "cell": {"userEnteredFormat": header_format},
+                            "fields": "userEnteredFormat(backgroundColor,textFormat)"
+                        }
+                    }
+                    for sheet_name, _, header_format in header_specs
+                ]
             })
-            print(f"✓ Set up Summary Report headers ({len(headers)} columns)")
+            
+            for sheet_name, headers, _ in header_specs:
+                print(f"✓ Set up {sheet_name} headers ({len(headers)} columns)")
         except Exception as e:
-            print(f"✗ Failed to set up Summary Report headers: {e}")
+            print(f"✗ Failed to set up headers: {e}")
         
         # Remove or rename old Summary sheet if it exists
         try:
@@ -197,29 +369,45 @@ class SheetsPurgeManager:
         # Map old column names to indices
         col_map = {header.lower(): i for i, header in enumerate(headers)}
         
+        # Resolve column indices once rather than per cell
+        i_url = col_map.get('url', 1)
+        i_title = col_map.get('title', 0)
+        i_pub = col_map.get('published date', 2)
+        i_author = col_map.get('author', 3)
+        i_summary = col_map.get('summary', 4)
+        i_content = col_map.get('content', 5)
+        i_categories = col_map.get('categories', 6)
+        i_scraped = col_map.get('scraped', 7)
+        i_source = col_map.get('source', 8)
+        now = datetime.now()  # Shared fallback for rows without a usable date
+        # Local aliases keep global/attribute lookups out of the row loop
+        strptime = datetime.strptime
+        feed_lookup = _FEED_LOOKUP
+        custom_feed = SourceFeed.CUSTOM
+        
         for row in old_data[1:]:  # Skip header row
             try:
                 # Extract data with fallbacks
-                url = row[col_map.get('url', 1)] if len(row) > col_map.get('url', 1) else ""
-                title = row[col_map.get('title', 0)] if len(row) > col_map.get('title', 0) else ""
+                url = row[i_url] if len(row) > i_url else ""
+                title = row[i_title] if len(row) > i_title else ""
                 
                 if not url or not title:
                     continue  # Skip invalid rows
                 
                 # Parse published date
-                pub_date_str = row[col_map.get('published date', 2)] if len(row) > col_map.get('published date', 2) else ""
-                try:
-                    published_date = datetime.strptime(pub_date_str, "%Y-%m-%d %H:%M:%S")
-                except:
-                    published_date = datetime.now()  # Fallback to now
+                pub_date_str = row[i_pub] if len(row) > i_pub else ""
+                # Only hand plausible "YYYY-MM-DD HH:MM:SS" strings to strptime so
+                # empty and malformed cells don't pay for a raised ValueError
+                published_date = now  # Fallback to now
+                if len(pub_date_str) == 19 and pub_date_str[4] == '-' and pub_date_str[7] == '-':
+                    try:
+                        published_date = strptime(pub_date_str, "%Y-%m-%d %H:%M:%S")
+                    except ValueError:
+                        pass
                 
                 # Determine source feed
-                source_str = row[col_map.get('source', 8)] if len(row) > col_map.get('source', 8) else ""
-                source_feed = SourceFeed.CUSTOM
-                for feed in SourceFeed:
-                    if feed.value.lower() == source_str.lower():
-                        source_feed = feed
-                        break
+                source_str = row[i_source] if len(row) > i_source else ""
+                source_feed = feed_lookup.get(source_str.lower(), custom_feed)
                 
                 # Create article with new standardized format
                 article = Article(
@@ -227,11 +415,11 @@ class SheetsPurgeManager:
                     title=title,
                     published_date=published_date,
                     source_feed=source_feed,
-                    description=row[col_map.get('summary', 4)] if len(row) > col_map.get('summary', 4) else "",
-                    content=row[col_map.get('content', 5)] if len(row) > col_map.get('content', 5) else "",
-                    author=row[col_map.get('author', 3)] if len(row) > col_map.get('author', 3) else "",
-                    scraping_success=str(row[col_map.get('scraped', 7)]).lower() == "true" if len(row) > col_map.get('scraped', 7) else False,
-                    categories=[c.strip() for c in row[col_map.get('categories', 6)].split(',') if c.strip()] if len(row) > col_map.get('categories', 6) else []
+                    description=row[i_summary] if len(row) > i_summary else "",
+                    content=row[i_content] if len(row) > i_content else "",
+                    author=row[i_author] if len(row) > i_author else "",
+                    scraping_success=str(row[i_scraped]).lower() == "true" if len(row) > i_scraped else False,
+                    categories=[c.strip() for c in row[i_categories].split(',') if c.strip()] if len(row) > i_categories else []
                 )
                 
                 articles.append(article)
@@ -261,36 +449,36 @@ class SheetsPurgeManager:
         # Map old column names to indices
         col_map = {header.lower(): i for i, header in enumerate(headers)}
         
+        # Resolve column indices once rather than per cell
+        i_title = col_map.get('title', 0)
+        i_type = col_map.get('content type', 1)
+        i_keywords = col_map.get('keywords', 2)
+        i_themes = col_map.get('themes', 3)
+        i_sources = col_map.get('source articles', 4)
+        
         for row in old_data[1:]:  # Skip header row
             try:
                 # Extract data with fallbacks
-                title = row[col_map.get('title', 0)] if len(row) > col_map.get('title', 0) else ""
-                content_type_str = row[col_map.get('content type', 1)] if len(row) > col_map.get('content type', 1) else "blog"
+                title = row[i_title] if len(row) > i_title else ""
+                content_type_str = row[i_type] if len(row) > i_type else "blog"
                 
                 if not title:
                     continue  # Skip invalid rows
                 
                 # Map old content type to new enum
-                content_type = ContentType.BLOG_POST  # Default
-                type_mapping = {
-                    "blog post": ContentType.BLOG_POST,
-                    "video script": ContentType.VIDEO,
-                    "social media post": ContentType.SOCIAL_MEDIA,
-                    "podcast": ContentType.PODCAST,
-                    "infographic": ContentType.INFOGRAPHIC
-                }
-                for old_type, new_type in type_mapping.items():
-                    if old_type in content_type_str.lower():
-                        content_type = new_type
-                        break
+                content_type_lower = content_type_str.lower()
+                content_type = next(
+                    (new_type for old_type, new_type in _TYPE_LOOKUP if old_type in content_type_lower),
+                    ContentType.BLOG_POST  # Default
+                )
                 
                 # Create content idea with new standardized format
                 idea = ContentIdea(
                     idea_title=title,
                     content_type=content_type,
-                    keywords=[k.strip() for k in row[col_map.get('keywords', 2)].split(',') if k.strip()] if len(row) > col_map.get('keywords', 2) else [],
-                    themes=[t.strip() for t in row[col_map.get('themes', 3)].split(',') if t.strip()] if len(row) > col_map.get('themes', 3) else [],
-                    source_articles=row[col_map.get('source articles', 4)].split('\n') if len(row) > col_map.get('source articles', 4) else [],
+                    keywords=[k.strip() for k in row[i_keywords].split(',') if k.strip()] if len(row) > i_keywords else [],
+                    themes=[t.strip() for t in row[i_themes].split(',') if t.strip()] if len(row) > i_themes else [],
+                    source_articles=row[i_sources].split('\n') if len(row) > i_sources else [],
                     priority=Priority.MEDIUM,  # Default priority
                     status=ContentStatus.PROPOSED  # Default status
                 )
@@ -304,6 +492,32 @@ class SheetsPurgeManager:
         print(f"  Migrated {len(ideas)} content ideas")
         return ideas
     
+    def _write_rows_chunked(self, worksheet, rows: List[List[Any]], start_row: int = 2):
+        """Write rows to an explicit range in chunks of WRITE_CHUNK_SIZE.
+        
+        The sheets were just cleared and given headers, so data always starts
+        at row 2. Writing to a known range avoids the table lookup that
+        append_rows() performs before every write.
+        
+        Args:
+            worksheet: Target worksheet
+            rows: Rows to write
+            start_row: 1-based row to start writing at
+        """
+        if not rows:
+            return
+        
+        # Grow the grid up front if the data won't fit
+        last_row = start_row + len(rows) - 1
+        if last_row > worksheet.row_count:
+            _retry(worksheet.add_rows, last_row - worksheet.row_count)
+        
+        for start in range(0, len(rows), self.WRITE_CHUNK_SIZE):
+            chunk = rows[start:start + self.WRITE_CHUNK_SIZE]
+            first = start_row + start
+            cell_range = f"A{first}:{rowcol_to_a1(first + len(chunk) - 1, max(len(r) for r in chunk))}"
+            _retry(worksheet.update, cell_range, chunk, value_input_option='USER_ENTERED')
+    
     def write_migrated_data(self, articles: List[Article], ideas: List[ContentIdea]):
         """Write migrated data back to sheets.
         
@@ -316,22 +530,20 @@ class SheetsPurgeManager:
         # Write articles
         if articles:
             try:
-                worksheet = self.sheets_manager.spreadsheet.worksheet("Articles")
+                worksheet = _retry(self.sheets_manager.spreadsheet.worksheet, "Articles")
                 rows = [article.to_sheet_row() for article in articles]
-                if rows:
-                    worksheet.append_rows(rows, value_input_option='USER_ENTERED')
-                    print(f"✓ Wrote {len(articles)} migrated articles")
+                self._write_rows_chunked(worksheet, rows)
+                print(f"✓ Wrote {len(articles)} migrated articles")
             except Exception as e:
                 print(f"✗ Failed to write articles: {e}")
         
         # Write content ideas
         if ideas:
             try:
-                worksheet = self.sheets_manager.spreadsheet.worksheet("Content Ideas")
+                worksheet = _retry(self.sheets_manager.spreadsheet.worksheet, "Content Ideas")
                 rows = [idea.to_sheet_row() for idea in ideas]
-                if rows:
-                    worksheet.append_rows(rows, value_input_option='USER_ENTERED')
-                    print(f"✓ Wrote {len(ideas)} migrated content ideas")
+                self._write_rows_chunked(worksheet, rows)
+                print(f"✓ Wrote {len(ideas)} migrated content ideas")
             except Exception as e:
                 print(f"✗ Failed to write content ideas: {e}")
     
@@ -362,8 +574,7 @@ class SheetsPurgeManager:
         
         # Step 2: Clear all sheets
         print("\n=== CLEARING EXISTING SHEETS ===")
-        for sheet_name in ["Articles", "Content Ideas", "Summary", "Summary Report"]:
-            self.clear_sheet(sheet_name)
+        self.clear_sheets(["Articles", "Content Ideas", "Summary", "Summary Report"])
         
         # Step 3: Set up new standardized headers
         self.setup_standardized_headers()
@@ -374,13 +585,13 @@ class SheetsPurgeManager:
             
             # Migrate articles
             if "Articles" in backups:
-                articles = self.migrate_articles(backups["Articles"])
+                articles = self.migrate_articles(self.load_backup(backups["Articles"]))
             else:
                 articles = []
             
             # Migrate content ideas
             if "Content Ideas" in backups:
-                ideas = self.migrate_content_ideas(backups["Content Ideas"])
+                ideas = self.migrate_content_ideas(self.load_backup(backups["Content Ideas"]))
             else:
                 ideas = []
             
@@ -6,6 +6,8 @@ Quick script to verify the Google Sheets schema is standardized correctly.
 import sys
 from pathlib import Path
 
+from gspread.utils import absolute_range_name
+
 # Add parent directory to path to import our modules
 sys.path.append(str(Path(__file__).parent.parent))
 
@@ -13,6 +15,26 @@ from src.content_pipeline.config import PipelineConfig
 from src.content_pipeline.sheets.google_sheets import GoogleSheetsManager
 
 
+def _batch_fetch(sheets_manager, ranges):
+    """Read several A1 ranges in a single values.batchGet request.
+    
+    Args:
+        sheets_manager: Connected GoogleSheetsManager
+        ranges: A1 ranges to read
+        
+    Returns:
+        Dictionary mapping each requested range to its rows
+    """
+    response = sheets_manager.spreadsheet.values_batch_get(
+        ranges, params={"majorDimension": "ROWS"}
+    )
+    value_ranges = response.get("valueRanges", [])
+    return {
+        requested: value_range.get("values", [])
+        for requested, value_range in zip(ranges, value_ranges)
+    }
+
+
 def verify_schema():
     """Verify that the Google Sheets have the correct standardized schema."""
     config = PipelineConfig()
@@ -32,15 +54,48 @@ def verify_schema():
     
     print("✓ Connected successfully\n")
     
-    # Import Article model to get the current schema
-    from src.content_pipeline.core.models import Article
+    # Import the models to get the current schema
+    from src.content_pipeline.core.models import Article, ContentIdea, SummaryReport
+    
+    # Read everything we check in a single values.batchGet request: the header
+    # and first data row of each sheet, plus its ID column for counting rows
+    sheet_names = ["Articles", "Content Ideas", "Summary Report"]
+    try:
+        # Only sheet titles are needed here, so mask the metadata response
+        metadata = sheets_manager.spreadsheet.fetch_sheet_metadata(
+            params={"fields": "sheets.properties.title"}
+        )
+        existing = {sheet["properties"]["title"] for sheet in metadata.get("sheets", [])}
+        found = [name for name in sheet_names if name in existing]
+        ranges = {
+            name: (absolute_range_name(name, "1:2"), absolute_range_name(name, "A:A"))
+            for name in found
+        }
+        fetched = _batch_fetch(sheets_manager, [r for pair in ranges.values() for r in pair])
+    except Exception as e:
+        print(f"✗ Failed to read sheets: {e}")
+        return False
+    
+    sheet_values = {
+        name: (fetched[top_range], fetched[id_range])
+        for name, (top_range, id_range) in ranges.items()
+    }
+    
+    def count_data_rows(id_column):
+        # Non-empty IDs below the header; blank rows in between don't count
+        return sum(1 for row in id_column[1:] if row and row[0])
+    
+    def get_sheet(sheet_name):
+        if sheet_name not in sheet_values:
+            raise ValueError(f"Worksheet '{sheet_name}' not found")
+        return sheet_values[sheet_name]
     
     # Check Articles sheet
     print("📋 Articles Sheet:")
     try:
-        worksheet = sheets_manager.spreadsheet.worksheet("Articles")
-        headers = worksheet.row_values(1)
-        data_rows = len(worksheet.get_all_values()) - 1  # Subtract header row
+        top_rows, id_column = get_sheet("Articles")
+        headers = top_rows[0] if top_rows else []
+        data_rows = count_data_rows(id_column)
         
         # Get expected headers from the Article model
         expected_headers = Article.sheet_headers()
@@ -74,15 +129,11 @@ def verify_schema():
     # Check Content Ideas sheet
     print("\n📋 Content Ideas Sheet:")
     try:
-        worksheet = sheets_manager.spreadsheet.worksheet("Content Ideas")
-        headers = worksheet.row_values(1)
-        data_rows = len(worksheet.get_all_values()) - 1
+        top_rows, id_column = get_sheet("Content Ideas")
+        headers = top_rows[0] if top_rows else []
+        data_rows = count_data_rows(id_column)
         
-        expected_headers = [
-            "ID", "Idea Title", "Idea Description", "Target Audience",
-            "Content Type", "Priority", "Keywords", "Source Articles",
-            "Created At", "Status", "Themes"
-        ]
+        expected_headers = ContentIdea.sheet_headers()
         
         if headers == expected_headers:
             print(f"  ✓ Headers match standardized schema ({len(headers)} columns)")
@@ -98,16 +149,11 @@ def verify_schema():
     # Check Summary Report sheet
     print("\n📋 Summary Report Sheet:")
     try:
-        worksheet = sheets_manager.spreadsheet.worksheet("Summary Report")
-        headers = worksheet.row_values(1)
-        data_rows = len(worksheet.get_all_values()) - 1
+        top_rows, id_column = get_sheet("Summary Report")
+        headers = top_rows[0] if top_rows else []
+        data_rows = count_data_rows(id_column)
         
-        expected_headers = [
-            "Run ID", "Run Date", "Total Articles Fetched",
-            "Articles Scraped Successfully", "Scraping Success Rate",
-            "Ideas Generated", "Processing Time (seconds)",
-            "Errors", "Feed Statistics"
-        ]
+        expected_headers = SummaryReport.sheet_headers()
         
         if headers == expected_headers:
             print(f"  ✓ Headers match standardized schema ({len(headers)} columns)")
@@ -119,7 +165,7 @@ def verify_schema():
         
         # Show latest run if available
         if data_rows > 0:
-            latest_row = worksheet.row_values(2)  # Get first data row
+            latest_row = top_rows[1] if len(top_rows) > 1 else []  # Get first data row
             print(f"\n  📈 Latest Run:")
             print(f"     - Date: {latest_row[1] if len(latest_row) > 1 else 'N/A'}")
             print(f"     - Articles: {latest_row[2] if len(latest_row) > 2 else 'N/A'}")
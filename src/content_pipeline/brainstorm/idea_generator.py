@@ -7,34 +7,46 @@ from collections import Counter
 from ..core.models import Article, ContentIdea, ContentType
 
 
+# Module-level so every IdeaGenerator shares one copy of the lookup tables
+# and compiled patterns
+
+# Common stop words to filter out
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'this', 'that', 'these', 'those', 'is', 'are',
+    'was', 'were', 'be', 'been', 'have', 'has', 'had', 'will', 'would',
+    'could', 'should', 'may', 'might', 'can', 'do', 'does', 'did', 'get',
+    'got', 'go', 'goes', 'went', 'come', 'came', 'take', 'took', 'make',
+    'made', 'see', 'saw', 'know', 'knew', 'think', 'thought', 'say', 'said'
+})
+
+# Patterns used on every text/title, compiled once.
+# Runs of word characters at least 4 long; the same tokens as replacing
+# punctuation with spaces, splitting and dropping words of 3 chars or less
+_TOKEN_RE = re.compile(r'\w{4,}')
+_PREFIX_RE = re.compile(r'^(the|a|an)\s+')
+_SUFFIX_RE = re.compile(r'\s+(news|report|update|analysis)$')
+
+# Predefined theme categories
+THEME_CATEGORIES = {
+    'technology': ['tech', 'digital', 'software', 'data', 'ai', 'automation', 'platform', 'system'],
+    'business': ['business', 'company', 'market', 'industry', 'revenue', 'growth', 'strategy'],
+    'logistics': ['shipping', 'freight', 'supply', 'chain', 'transportation', 'delivery', 'warehouse'],
+    'finance': ['financial', 'investment', 'cost', 'price', 'funding', 'capital', 'money'],
+    'environment': ['sustainable', 'green', 'environment', 'carbon', 'emission', 'climate'],
+    'regulation': ['regulation', 'compliance', 'policy', 'government', 'law', 'legal']
+}
+
+# One alternation per theme, so matching a keyword is a single regex scan
+_THEME_PATTERNS = {
+    name: re.compile('|'.join(map(re.escape, words)))
+    for name, words in THEME_CATEGORIES.items()
+}
+
+
 class IdeaGenerator:
     """Generates content ideas based on scraped articles."""
     
-    def __init__(self):
-        """Initialize the idea generator."""
-        self.content_types = [
-            "Blog Post",
-            "Social Media Post",
-            "Newsletter",
-            "Video Script",
-            "Infographic",
-            "Whitepaper",
-            "Case Study",
-            "Tutorial",
-            "Listicle",
-            "Analysis"
-        ]
-        
-        # Common stop words to filter out
-        self.stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'this', 'that', 'these', 'those', 'is', 'are',
-            'was', 'were', 'be', 'been', 'have', 'has', 'had', 'will', 'would',
-            'could', 'should', 'may', 'might', 'can', 'do', 'does', 'did', 'get',
-            'got', 'go', 'goes', 'went', 'come', 'came', 'take', 'took', 'make',
-            'made', 'see', 'saw', 'know', 'knew', 'think', 'thought', 'say', 'said'
-        }
-    
     def generate_ideas(self, articles: List[Article]) -> List[ContentIdea]:
         """Generate content ideas from a list of articles.
         
@@ -49,13 +61,30 @@ class IdeaGenerator:
         
         ideas = []
         
+        # Tokenize each article once; the per-article counts give both the
+        # article's own keywords and, summed, the keywords for the whole batch
+        article_counts = [self._count_words(article) for article in articles]
+        total_counts = Counter()
+        for counts in article_counts:
+            total_counts.update(counts)
+        
         # Extract themes and keywords
-        all_keywords = self._extract_keywords(articles)
+        all_keywords = [word for word, _ in total_counts.most_common(50)]
         themes = self._identify_themes(articles, all_keywords)
         
+        # One alternation per theme, so relating an article to a theme is a
+        # single regex scan of its text
+        theme_patterns = {
+            theme: re.compile('|'.join(map(re.escape, keywords)))
+            for theme, keywords in themes.items()
+        }
+        
         # Generate ideas based on individual articles
-        for article in articles:
-            article_ideas = self._generate_article_ideas(article, themes)
+        for article, counts in zip(articles, article_counts):
+            article_keywords = [word for word, _ in counts.most_common(5)]
+            article_ideas = self._generate_article_ideas(
+                article, themes, article_keywords, theme_patterns
+            )
             ideas.extend(article_ideas)
         
         # Generate cross-article ideas
@@ -67,39 +96,30 @@ class IdeaGenerator:
         
         return unique_ideas[:10]  # Return top 10 ideas
     
-    def _extract_keywords(self, articles: List[Article]) -> List[str]:
-        """Extract keywords from articles.
+    def _count_words(self, article: Article) -> Counter:
+        """Count keyword candidates in a single article.
         
         Args:
-            articles: List of articles
+            article: Article to tokenize
             
         Returns:
-            List of keywords sorted by frequency
+            Counter of words, in first-seen order
         """
-        all_text = []
-        
-        for article in articles:
-            # Combine title, summary, and content
-            text_parts = [article.title, article.summary]
-            if hasattr(article, 'content') and article.content:
-                text_parts.append(article.content)
-            
-            all_text.extend(text_parts)
-        
-        # Extract words
-        words = []
-        for text in all_text:
-            if text:
-                # Clean and split text
-                clean_text = re.sub(r'[^\w\s]', ' ', text.lower())
-                text_words = clean_text.split()
-                words.extend([w for w in text_words if len(w) > 3 and w not in self.stop_words])
-        
-        # Count word frequency
-        word_counts = Counter(words)
-        
-        # Return top keywords
-        return [word for word, _ in word_counts.most_common(50)]
+        # Combine title, summary, and content
+        text_parts = [article.title, article.summary]
+        if article.content:
+            text_parts.append(article.content)
+        
+        # One lower()/findall over the joined text; the space separator can't
+        # be part of a token, so this yields the same words as per-part scans.
+        # Counter counts the token list in C, and stop words are dropped
+        # afterwards by set intersection instead of testing every token.
+        text = ' '.join(part for part in text_parts if part)
+        word_counts = Counter(_TOKEN_RE.findall(text.lower()))
+        for word in STOP_WORDS.intersection(word_counts):
+            del word_counts[word]
+        
+        return word_counts
     
     def _identify_themes(self, articles: List[Article], keywords: List[str]) -> Dict[str, List[str]]:
         """Identify common themes across articles.
@@ -113,33 +133,25 @@ class IdeaGenerator:
         """
         themes = {}
         
-        # Predefined theme categories
-        theme_categories = {
-            'technology': ['tech', 'digital', 'software', 'data', 'ai', 'automation', 'platform', 'system'],
-            'business': ['business', 'company', 'market', 'industry', 'revenue', 'growth', 'strategy'],
-            'logistics': ['shipping', 'freight', 'supply', 'chain', 'transportation', 'delivery', 'warehouse'],
-            'finance': ['financial', 'investment', 'cost', 'price', 'funding', 'capital', 'money'],
-            'environment': ['sustainable', 'green', 'environment', 'carbon', 'emission', 'climate'],
-            'regulation': ['regulation', 'compliance', 'policy', 'government', 'law', 'legal']
-        }
-        
-        for theme_name, theme_words in theme_categories.items():
-            matching_keywords = []
-            for keyword in keywords:
-                if any(theme_word in keyword for theme_word in theme_words):
-                    matching_keywords.append(keyword)
+        for theme_name, pattern in _THEME_PATTERNS.items():
+            # A keyword belongs to a theme if it contains any of the theme's words
+            matching_keywords = [keyword for keyword in keywords if pattern.search(keyword)]
             
             if matching_keywords:
                 themes[theme_name] = matching_keywords[:10]  # Top 10 keywords per theme
         
         return themes
     
-    def _generate_article_ideas(self, article: Article, themes: Dict[str, List[str]]) -> List[ContentIdea]:
+    def _generate_article_ideas(self, article: Article, themes: Dict[str, List[str]],
+                                article_keywords: List[str],
+                                theme_patterns: Dict[str, re.Pattern]) -> List[ContentIdea]:
         """Generate ideas based on a single article.
         
         Args:
             article: Single article
             themes: Identified themes
+            article_keywords: The article's own top keywords, most frequent first
+            theme_patterns: Compiled alternation of each theme's keywords
             
         Returns:
             List of content ideas
@@ -148,11 +160,10 @@ class IdeaGenerator:
         
         # Find which themes this article relates to
         article_text = f"{article.title} {article.summary}".lower()
-        related_themes = []
-        
-        for theme, keywords in themes.items():
-            if any(keyword in article_text for keyword in keywords):
-                related_themes.append(theme)
+        related_themes = [
+            theme for theme, pattern in theme_patterns.items()
+            if pattern.search(article_text)
+        ]
         
         # Generate different types of content ideas
         idea_templates = [
@@ -163,23 +174,27 @@ class IdeaGenerator:
             "Breaking Down {title}: What You Need to Know"
         ]
         
+        # The topic and keywords are the same for every template
+        main_topic = self._extract_main_topic(article.title)
+        
+        # Select keywords from related themes
+        idea_keywords = []
+        for theme in related_themes:
+            idea_keywords.extend(themes[theme][:3])
+        
+        # Add article-specific keywords
+        idea_keywords.extend(article_keywords[:5])
+        
+        # Drop repeats but keep first-seen order so output is deterministic
+        idea_keywords = list(dict.fromkeys(idea_keywords))
+        
         for template in idea_templates:
-            main_topic = self._extract_main_topic(article.title)
             idea_title = template.format(title=main_topic)
             
-            # Select keywords from related themes
-            idea_keywords = []
-            for theme in related_themes:
-                idea_keywords.extend(themes[theme][:3])
-            
-            # Add article-specific keywords
-            article_keywords = self._extract_keywords([article])
-            idea_keywords.extend(article_keywords[:5])
-            
             idea = ContentIdea(
                 idea_title=idea_title,  # Using standardized field name
                 content_type=self._select_content_type(template),
-                keywords=list(set(idea_keywords)),
+                keywords=list(idea_keywords),
                 source_articles=[article.url],
                 themes=related_themes
             )
@@ -199,6 +214,10 @@ class IdeaGenerator:
         """
         ideas = []
         
+        # Every cross-article idea cites the whole batch; nothing downstream
+        # mutates source_articles, so the ideas can share one list
+        all_urls = [article.url for article in articles]
+        
         # Generate theme-based ideas
         for theme, keywords in themes.items():
             if len(keywords) >= 3:
@@ -214,7 +233,7 @@ class IdeaGenerator:
                         idea_title=idea_title,  # Using standardized field name
                         content_type=ContentType.NEWSLETTER,  # Using enum
                         keywords=keywords[:10],
-                        source_articles=[article.url for article in articles],
+                        source_articles=all_urls,
                         themes=[theme]
                     )
                     ideas.append(idea)
@@ -231,8 +250,8 @@ class IdeaGenerator:
             Main topic string
         """
         # Remove common prefixes and suffixes
-        clean_title = re.sub(r'^(the|a|an)\s+', '', title.lower())
-        clean_title = re.sub(r'\s+(news|report|update|analysis)$', '', clean_title)
+        clean_title = _PREFIX_RE.sub('', title.lower())
+        clean_title = _SUFFIX_RE.sub('', clean_title)
         
         # Limit length
         if len(clean_title) > 50:
@@ -273,15 +292,15 @@ class IdeaGenerator:
         Returns:
             Deduplicated and sorted list of ideas
         """
-        seen_titles = set()
-        unique_ideas = []
+        # Key on the normalized title so case and trailing punctuation don't
+        # produce near-duplicates; on a collision keep the better-keyworded idea
+        best: Dict[str, ContentIdea] = {}
         
         for idea in ideas:
-            if idea.idea_title not in seen_titles:  # Using standardized field name
-                seen_titles.add(idea.idea_title)
-                unique_ideas.append(idea)
+            key = idea.idea_title.lower().strip(' .?!:')  # Using standardized field name
+            current = best.get(key)
+            if current is None or len(idea.keywords) > len(current.keywords):
+                best[key] = idea
         
         # Sort by number of keywords (more keywords = more relevant)
-        unique_ideas.sort(key=lambda x: len(x.keywords), reverse=True)
-        
-        return unique_ideas
\ No newline at end of file
+        return sorted(best.values(), key=lambda x: len(x.keywords), reverse=True)
\ No newline at end of file
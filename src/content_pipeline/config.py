@@ -1,7 +1,9 @@
 """Configuration settings for the content pipeline."""
 
-from dataclasses import dataclass
-from typing import List
+import os
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import List, Optional
 
 
 @dataclass
@@ -13,11 +15,30 @@ class FeedConfig:
     enabled: bool = True
 
 
+# Feeds monitored when none are configured. Built once at import; each
+# PipelineConfig gets its own list, but the FeedConfig entries are shared
+# and should be treated as read-only.
+DEFAULT_FEEDS = (
+    FeedConfig(
+        name="FreightWaves",
+        url="https://www.freightwaves.com/feed",
+        article_limit=5,
+        enabled=True
+    ),
+    FeedConfig(
+        name="FreightCaviar",
+        url="https://www.freightcaviar.com/latest/rss",
+        article_limit=5,
+        enabled=True
+    )
+)
+
+
 @dataclass
 class PipelineConfig:
     """Main configuration for the content pipeline."""
     # RSS Feeds to monitor
-    feeds: List[FeedConfig] = None
+    feeds: List[FeedConfig] = field(default_factory=lambda: list(DEFAULT_FEEDS))
     
     # Google Sheets configuration
     credentials_path: str = "content-pipeline-bot-key.json"
@@ -26,27 +47,18 @@ class PipelineConfig:
     # Scraping configuration - Updated for production reliability
     scraper_delay: float = 2.0  # Increased from 1.0 to avoid rate limiting
     scraper_timeout: int = 20  # Increased from 10 for slower connections
+    scraper_workers: int = 4  # Articles scraped concurrently; requests per host stay paced by scraper_delay
+    
+    # ETag/Last-Modified cache for conditional feed requests (None disables it)
+    feed_cache_path: Optional[str] = "~/.cache/content-pipeline/feeds.json"
     
     # Default article limit if not specified per feed
     default_article_limit: int = 5
     
     def __post_init__(self):
-        """Initialize default feeds if none provided."""
+        """Fall back to the default feeds if None was passed explicitly."""
         if self.feeds is None:
-            self.feeds = [
-                FeedConfig(
-                    name="FreightWaves",
-                    url="https://www.freightwaves.com/feed",
-                    article_limit=5,
-                    enabled=True
-                ),
-                FeedConfig(
-                    name="FreightCaviar",
-                    url="https://www.freightcaviar.com/latest/rss",
-                    article_limit=5,
-                    enabled=True
-                )
-            ]
+            self.feeds = list(DEFAULT_FEEDS)
     
     def get_enabled_feeds(self) -> List[FeedConfig]:
         """Get only enabled feeds."""
@@ -56,16 +68,23 @@ class PipelineConfig:
         """Get total number of articles to process across all feeds."""
         return sum(feed.article_limit for feed in self.get_enabled_feeds())
     
+    @cached_property
+    def _sheets_credentials_path(self) -> str:
+        """Credentials path resolved from the environment, read once per instance."""
+        return os.getenv('GOOGLE_SHEETS_CREDENTIALS_PATH', self.credentials_path)
+    
+    @cached_property
+    def _sheets_spreadsheet_id(self) -> str:
+        """Spreadsheet ID resolved from the environment, read once per instance."""
+        return os.getenv('GOOGLE_SHEETS_SPREADSHEET_ID', self.spreadsheet_id)
+    
     def get_google_sheets_credentials_path(self) -> str:
         """Get Google Sheets credentials path from environment or default."""
-        import os
-        return os.getenv('GOOGLE_SHEETS_CREDENTIALS_PATH', self.credentials_path)
+        return self._sheets_credentials_path
     
     def get_google_sheets_spreadsheet_id(self) -> str:
         """Get Google Sheets spreadsheet ID from environment or default."""
-        import os
-        return os.getenv('GOOGLE_SHEETS_SPREADSHEET_ID', self.spreadsheet_id)
-
+        return self._sheets_spreadsheet_id
 
 # Default configuration instance
 DEFAULT_CONFIG = PipelineConfig()
\ No newline at end of file
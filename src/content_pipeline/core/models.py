@@ -1,11 +1,15 @@
 """Standardized data models for the content pipeline with validation and type safety."""
 
+import json
 import re
+import sys
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, ClassVar, Tuple, Iterator
 from urllib.parse import urlparse
 
 
@@ -16,6 +20,10 @@ class SourceFeed(str, Enum):
     CUSTOM = "Custom"
 
 
+# Case-insensitive lookup used by the legacy Article.source setter
+_SOURCE_FEED_BY_NAME = {feed.value.lower(): feed for feed in SourceFeed}
+
+
 class ScrapingStrategy(str, Enum):
     """Enumeration of scraping strategies."""
     BASIC = "basic"
@@ -53,8 +61,18 @@ class ContentStatus(str, Enum):
     ON_HOLD = "on_hold"
 
 
-def validate_url(url: str) -> bool:
-    """Validate if a string is a valid URL."""
+# Plain ASCII scheme://host URLs; any URL matching this has a non-empty scheme
+# and netloc under urlparse, so it can skip building a ParseResult
+_SIMPLE_URL_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://[A-Za-z0-9\-._~%!$&'()*+,;=:@]+(?:[/?#]|$)")
+
+
+@lru_cache(maxsize=4096)
+def _parse_url_valid(url: str) -> bool:
+    """Check a non-empty URL has a scheme and netloc, caching the answer."""
+    if _SIMPLE_URL_RE.match(url):
+        return True
+    
+    # Anything unusual (IPv6 hosts, unicode, stray whitespace) goes through urlparse
     try:
         result = urlparse(url)
         return all([result.scheme, result.netloc])
@@ -62,17 +80,39 @@ def validate_url(url: str) -> bool:
         return False
 
 
+def validate_url(url: str) -> bool:
+    """Validate if a string is a valid URL."""
+    # Empty values are never valid; keep them out of the cache
+    if not url:
+        return False
+    return _parse_url_valid(url)
+
+
+# Control characters mapped to spaces by sanitize_text(); str.translate with a
+# prebuilt table avoids running the regex engine over every text
+_CONTROL_CHAR_TABLE = str.maketrans({
+    code: ' ' for code in [*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]
+})
+
+
 def sanitize_text(text: str, max_length: Optional[int] = None) -> str:
     """Sanitize text by removing control characters and limiting length."""
     if not text:
         return ""
     
-    # Remove control characters except spaces, newlines and tabs
-    # This regex preserves spaces (0x20), tabs (0x09), and newlines (0x0A, 0x0D)
-    sanitized = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', ' ', text)
-    
-    # Normalize whitespace (multiple spaces/tabs/newlines to single space)
-    sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+    # Fast path: isprintable() rejects control characters and every whitespace
+    # character except the plain space, so single-spaced, unpadded text is
+    # already clean
+    if text.isprintable() and '  ' not in text and text[0] != ' ' and text[-1] != ' ':
+        sanitized = text
+    else:
+        # Remove control characters except spaces, newlines and tabs
+        # The table preserves spaces (0x20), tabs (0x09), and newlines (0x0A, 0x0D)
+        sanitized = text.translate(_CONTROL_CHAR_TABLE)
+        
+        # Normalize whitespace (multiple spaces/tabs/newlines to single space);
+        # split() uses the same whitespace definition as the regex \s
+        sanitized = ' '.join(sanitized.split())
     
     # Apply max length if specified
     if max_length and len(sanitized) > max_length:
@@ -81,7 +121,88 @@ def sanitize_text(text: str, max_length: Optional[int] = None) -> str:
     return sanitized
 
 
-@dataclass
+# Timestamp shared by every model created inside pipeline_run(); None outside a run
+_RUN_NOW: Optional[datetime] = None
+
+
+def _now() -> datetime:
+    """Return the current run's timestamp, or the wall clock outside a run."""
+    return _RUN_NOW or datetime.now()
+
+
+@contextmanager
+def pipeline_run(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """Stamp models created inside the block with one shared timestamp.
+    
+    Args:
+        now: Timestamp to use (defaults to the current time)
+        
+    Yields:
+        The timestamp applied to created_at/updated_at defaults
+    """
+    global _RUN_NOW
+    previous = _RUN_NOW
+    _RUN_NOW = now or datetime.now()
+    try:
+        yield _RUN_NOW
+    finally:
+        _RUN_NOW = previous
+
+
+# Model dataclasses drop the per-instance __dict__ where dataclasses supports it
+# (Python 3.10+); older interpreters get regular dataclasses
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Standardized Google Sheets headers; sheet_headers() hands out copies
+ARTICLE_SHEET_HEADERS = (
+    "ID",
+    "URL",
+    "Title",
+    "Description",
+    "Content",
+    "Author",
+    "Published Date",
+    "Source Feed",
+    "Scraping Strategy",
+    "Scraping Success",
+    "Created At",
+    "Updated At",
+    "Word Count",
+    "Extraction Confidence",
+    "Failure Reason",
+    "Keywords",
+    "Categories",
+)
+
+CONTENT_IDEA_SHEET_HEADERS = (
+    "ID",
+    "Idea Title",
+    "Idea Description",
+    "Target Audience",
+    "Content Type",
+    "Priority",
+    "Keywords",
+    "Source Articles",
+    "Created At",
+    "Status",
+    "Themes",
+)
+
+SUMMARY_REPORT_SHEET_HEADERS = (
+    "Run ID",
+    "Run Date",
+    "Total Articles Fetched",
+    "Articles Scraped Successfully",
+    "Scraping Success Rate",
+    "Ideas Generated",
+    "Processing Time (seconds)",
+    "Errors",
+    "Feed Statistics",
+)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Article:
     """
     Represents a standardized news article with validation and metadata.
@@ -103,6 +224,9 @@ class Article:
         keywords: List of keywords/tags
         categories: List of categories
     """
+    # Standardized sheet headers (not a dataclass field)
+    SHEET_HEADERS: ClassVar[Tuple[str, ...]] = ARTICLE_SHEET_HEADERS
+    
     # Required fields
     url: str
     title: str
@@ -118,8 +242,8 @@ class Article:
     scraping_success: bool = False
     extraction_confidence: float = 0.0  # 0.0 to 1.0 confidence score
     failure_reason: str = ""  # Detailed failure reason if scraping failed
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
     word_count: int = 0
     keywords: List[str] = field(default_factory=list)
     categories: List[str] = field(default_factory=list)
@@ -130,6 +254,12 @@ class Article:
         if not validate_url(self.url):
             raise ValueError(f"Invalid URL: {self.url}")
         
+        # Coerce plain strings to enum members so serialization can use .value
+        if not isinstance(self.source_feed, SourceFeed):
+            self.source_feed = SourceFeed(self.source_feed)
+        if not isinstance(self.scraping_strategy, ScrapingStrategy):
+            self.scraping_strategy = ScrapingStrategy(self.scraping_strategy)
+        
         # Sanitize text fields
         self.title = sanitize_text(self.title, max_length=500)
         if not self.title:
@@ -142,15 +272,9 @@ class Article:
         if self.content:
             self.word_count = len(self.content.split())
         
-        # Ensure lists are properly initialized
-        if self.keywords is None:
-            self.keywords = []
-        if self.categories is None:
-            self.categories = []
-        
-        # Clean up lists
-        self.keywords = [sanitize_text(k, max_length=50) for k in self.keywords if k]
-        self.categories = [sanitize_text(c, max_length=100) for c in self.categories if c]
+        # Clean up lists (an explicit None becomes an empty list)
+        self.keywords = [sanitize_text(k, max_length=50) for k in self.keywords or () if k]
+        self.categories = [sanitize_text(c, max_length=100) for c in self.categories or () if c]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert article to dictionary for serialization."""
@@ -162,8 +286,8 @@ class Article:
             "content": self.content,
             "author": self.author,
             "published_date": self.published_date.isoformat() if self.published_date else None,
-            "source_feed": self.source_feed.value if isinstance(self.source_feed, Enum) else self.source_feed,
-            "scraping_strategy": self.scraping_strategy.value if isinstance(self.scraping_strategy, Enum) else self.scraping_strategy,
+            "source_feed": self.source_feed.value,
+            "scraping_strategy": self.scraping_strategy.value,
             "scraping_success": self.scraping_success,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
@@ -184,8 +308,8 @@ class Article:
             self.content,  # Full content, no truncation in data layer
             self.author,
             self.published_date.strftime("%Y-%m-%d %H:%M:%S") if self.published_date else "",
-            self.source_feed.value if isinstance(self.source_feed, Enum) else self.source_feed,
-            self.scraping_strategy.value if isinstance(self.scraping_strategy, Enum) else self.scraping_strategy,
+            self.source_feed.value,
+            self.scraping_strategy.value,
             "Yes" if self.scraping_success else "No",
             self.created_at.strftime("%Y-%m-%d %H:%M:%S") if self.created_at else "",
             self.updated_at.strftime("%Y-%m-%d %H:%M:%S") if self.updated_at else "",
@@ -199,25 +323,7 @@ class Article:
     @staticmethod
     def sheet_headers() -> List[str]:
         """Return standardized headers for Google Sheets."""
-        return [
-            "ID",
-            "URL",
-            "Title",
-            "Description",
-            "Content",
-            "Author",
-            "Published Date",
-            "Source Feed",
-            "Scraping Strategy",
-            "Scraping Success",
-            "Created At",
-            "Updated At",
-            "Word Count",
-            "Extraction Confidence",
-            "Failure Reason",
-            "Keywords",
-            "Categories"
-        ]
+        return list(ARTICLE_SHEET_HEADERS)
     
     # Backward compatibility properties
     @property
@@ -243,20 +349,16 @@ class Article:
     @property
     def source(self) -> str:
         """Legacy property mapping to source_feed."""
-        return self.source_feed.value if isinstance(self.source_feed, Enum) else self.source_feed
+        return self.source_feed.value
     
     @source.setter
     def source(self, value: str):
         """Legacy property setter mapping to source_feed."""
         # Try to map to enum, fallback to CUSTOM
-        for feed in SourceFeed:
-            if feed.value.lower() == str(value).lower():
-                self.source_feed = feed
-                return
-        self.source_feed = SourceFeed.CUSTOM
+        self.source_feed = _SOURCE_FEED_BY_NAME.get(str(value).lower(), SourceFeed.CUSTOM)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ContentIdea:
     """
     Represents a standardized content idea with lifecycle tracking.
@@ -274,6 +376,9 @@ class ContentIdea:
         status: Current status of the idea
         themes: Content themes
     """
+    # Standardized sheet headers (not a dataclass field)
+    SHEET_HEADERS: ClassVar[Tuple[str, ...]] = CONTENT_IDEA_SHEET_HEADERS
+    
     # Required fields
     idea_title: str
     content_type: ContentType
@@ -285,12 +390,20 @@ class ContentIdea:
     priority: Priority = Priority.MEDIUM
     keywords: List[str] = field(default_factory=list)
     source_articles: List[str] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now)
     status: ContentStatus = ContentStatus.PROPOSED
     themes: List[str] = field(default_factory=list)
     
     def __post_init__(self):
         """Validate and sanitize data after initialization."""
+        # Coerce plain strings to enum members so serialization can use .value
+        if not isinstance(self.content_type, ContentType):
+            self.content_type = ContentType(self.content_type)
+        if not isinstance(self.priority, Priority):
+            self.priority = Priority(self.priority)
+        if not isinstance(self.status, ContentStatus):
+            self.status = ContentStatus(self.status)
+        
         # Sanitize text fields
         self.idea_title = sanitize_text(self.idea_title, max_length=200)
         if not self.idea_title:
@@ -300,16 +413,12 @@ class ContentIdea:
         self.target_audience = sanitize_text(self.target_audience, max_length=100)
         
         # Ensure lists are properly initialized
-        if self.keywords is None:
-            self.keywords = []
         if self.source_articles is None:
             self.source_articles = []
-        if self.themes is None:
-            self.themes = []
         
-        # Clean up lists
-        self.keywords = [sanitize_text(k, max_length=50) for k in self.keywords if k]
-        self.themes = [sanitize_text(t, max_length=100) for t in self.themes if t]
+        # Clean up lists (an explicit None becomes an empty list)
+        self.keywords = [sanitize_text(k, max_length=50) for k in self.keywords or () if k]
+        self.themes = [sanitize_text(t, max_length=100) for t in self.themes or () if t]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert content idea to dictionary for serialization."""
@@ -318,12 +427,12 @@ class ContentIdea:
             "idea_title": self.idea_title,
             "idea_description": self.idea_description,
             "target_audience": self.target_audience,
-            "content_type": self.content_type.value if isinstance(self.content_type, Enum) else self.content_type,
-            "priority": self.priority.value if isinstance(self.priority, Enum) else self.priority,
+            "content_type": self.content_type.value,
+            "priority": self.priority.value,
             "keywords": self.keywords,
             "source_articles": self.source_articles,
             "created_at": self.created_at.isoformat() if self.created_at else None,
-            "status": self.status.value if isinstance(self.status, Enum) else self.status,
+            "status": self.status.value,
             "themes": self.themes
         }
     
@@ -334,31 +443,19 @@ class ContentIdea:
             self.idea_title,
             self.idea_description,
             self.target_audience,
-            self.content_type.value if isinstance(self.content_type, Enum) else self.content_type,
-            self.priority.value if isinstance(self.priority, Enum) else self.priority,
+            self.content_type.value,
+            self.priority.value,
             ", ".join(self.keywords) if self.keywords else "",
             ", ".join(self.source_articles) if self.source_articles else "",
             self.created_at.strftime("%Y-%m-%d %H:%M:%S") if self.created_at else "",
-            self.status.value if isinstance(self.status, Enum) else self.status,
+            self.status.value,
             ", ".join(self.themes) if self.themes else ""
         ]
     
     @staticmethod
     def sheet_headers() -> List[str]:
         """Return standardized headers for Google Sheets."""
-        return [
-            "ID",
-            "Idea Title",
-            "Idea Description",
-            "Target Audience",
-            "Content Type",
-            "Priority",
-            "Keywords",
-            "Source Articles",
-            "Created At",
-            "Status",
-            "Themes"
-        ]
+        return list(CONTENT_IDEA_SHEET_HEADERS)
     
     # Backward compatibility properties
     @property
@@ -382,7 +479,7 @@ class ContentIdea:
         self.idea_description = value
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SummaryReport:
     """
     Represents a pipeline run summary with structured metrics.
@@ -398,6 +495,9 @@ class SummaryReport:
         errors: List of errors encountered
         feed_statistics: Per-feed statistics
     """
+    # Standardized sheet headers (not a dataclass field)
+    SHEET_HEADERS: ClassVar[Tuple[str, ...]] = SUMMARY_REPORT_SHEET_HEADERS
+    
     # Required fields
     run_date: datetime
     total_articles_fetched: int
@@ -435,8 +535,6 @@ class SummaryReport:
     
     def to_sheet_row(self) -> List[Any]:
         """Convert summary report to a row format for Google Sheets."""
-        import json
-        
         return [
             self.run_id,
             self.run_date.strftime("%Y-%m-%d %H:%M:%S") if self.run_date else "",
@@ -452,14 +550,4 @@ class SummaryReport:
     @staticmethod
     def sheet_headers() -> List[str]:
         """Return standardized headers for Google Sheets."""
-        return [
-            "Run ID",
-            "Run Date",
-            "Total Articles Fetched",
-            "Articles Scraped Successfully",
-            "Scraping Success Rate",
-            "Ideas Generated",
-            "Processing Time (seconds)",
-            "Errors",
-            "Feed Statistics"
-        ]
\ No newline at end of file
+        return list(SUMMARY_REPORT_SHEET_HEADERS)
\ No newline at end of file
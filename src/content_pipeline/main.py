@@ -2,18 +2,24 @@
 
 import os
 import sys
+import hashlib
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional, Dict, Callable
+from urllib.parse import urlsplit
 
-# Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from content_pipeline.scrapers.rss_monitor import RSSMonitor
-from content_pipeline.scrapers.scraper import create_scraper
-from content_pipeline.brainstorm.idea_generator import IdeaGenerator
-from content_pipeline.sheets.google_sheets import GoogleSheetsManager
-from content_pipeline.core.models import Article
+# Running as a script from a source checkout: make the package importable
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from content_pipeline.scrapers.rss_monitor import RSSMonitor, FeedCache
+from content_pipeline.core.models import Article, pipeline_run
 from content_pipeline.config import PipelineConfig, FeedConfig, DEFAULT_CONFIG
 
 # Configure logging
@@ -24,6 +30,43 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def article_fingerprint(article: Article) -> bytes:
+    """Fingerprint an article by its normalized URL and title.
+    
+    Query strings, fragments, case and trailing slashes are ignored in the URL,
+    so the same story linked with tracking parameters from two feeds matches.
+    
+    Args:
+        article: Article to fingerprint
+        
+    Returns:
+        SHA-256 digest of the normalized URL and title
+    """
+    parts = urlsplit(article.url)
+    url = f"{parts.netloc}{parts.path}".lower().rstrip('/')
+    title = (article.title or '').strip().lower()
+    return hashlib.sha256(f"{url}|{title}".encode('utf-8')).digest()
+
+
+def deduplicate_articles(articles: List[Article]) -> List[Article]:
+    """Drop repeated articles, keeping the first occurrence of each fingerprint.
+    
+    Args:
+        articles: Articles collected from all feeds
+        
+    Returns:
+        Articles in their original order without duplicates
+    """
+    seen = set()
+    unique = []
+    for article in articles:
+        fingerprint = article_fingerprint(article)
+        if fingerprint not in seen:
+            seen.add(fingerprint)
+            unique.append(article)
+    return unique
+
+
 class ContentPipeline:
     """Main content pipeline orchestrator with configurable scraping strategies."""
     
@@ -42,13 +85,21 @@ class ContentPipeline:
         self.credentials_path = self.config.credentials_path
         self.spreadsheet_id = self.config.spreadsheet_id
         self.scraping_strategy = scraping_strategy
+        # Snapshot of the feeds this pipeline monitors; matches self.rss_monitors
+        self._enabled_feeds = tuple(self.config.get_enabled_feeds())
+        
+        # Imported here so `--help` and config errors don't load gspread/google-auth
+        from content_pipeline.scrapers.scraper import create_scraper
+        from content_pipeline.brainstorm.idea_generator import IdeaGenerator
+        from content_pipeline.sheets.google_sheets import GoogleSheetsManager
         
         # Initialize components
         self.web_scraper = create_scraper(
             strategy=scraping_strategy,
             delay=self.config.scraper_delay,
             timeout=self.config.scraper_timeout,
-            mcp_functions=mcp_functions
+            mcp_functions=mcp_functions,
+            max_workers=self.config.scraper_workers
         )
         
         self.idea_generator = IdeaGenerator()
@@ -57,20 +108,39 @@ class ContentPipeline:
             self.config.spreadsheet_id
         )
         
-        # Create RSS monitors for each feed
+        # Create RSS monitors for each feed, sharing one pooled session
+        self.feed_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.feed_session.mount('https://', adapter)
+        self.feed_session.mount('http://', adapter)
+        
+        feed_cache = FeedCache(self.config.feed_cache_path) if self.config.feed_cache_path else None
+        
         self.rss_monitors = {}
-        for feed in self.config.get_enabled_feeds():
+        for feed in self._enabled_feeds:
             self.rss_monitors[feed.name] = RSSMonitor(
                 feed.url, 
-                timeout=self.config.scraper_timeout
+                timeout=self.config.scraper_timeout,
+                session=self.feed_session,
+                feed_cache=feed_cache
             )
         
         logger.info(f"ContentPipeline initialized with {scraping_strategy} strategy")
     
     def run_pipeline(self) -> bool:
         """Run the complete content pipeline for all configured feeds."""
+        # Articles and ideas created during this run share one timestamp
+        with pipeline_run():
+            return self._run_pipeline()
+    
+    def _run_pipeline(self) -> bool:
+        """Fetch, scrape, brainstorm and save; see run_pipeline()."""
         print("🚀 Starting Content Pipeline...")
-        print(f"📋 Processing {len(self.config.get_enabled_feeds())} feeds")
+        print(f"📋 Processing {len(self._enabled_feeds)} feeds")
         print(f"🔧 Scraping strategy: {self.scraping_strategy}")
         
         # Step 1: Test connections
@@ -82,17 +152,18 @@ class ContentPipeline:
         
         all_articles = []
         
-        # Step 2: Fetch RSS articles from all feeds
-        for feed in self.config.get_enabled_feeds():
-            print(f"\n📡 Fetching articles from {feed.name}...")
-            print(f"   URL: {feed.url}")
-            print(f"   Article limit: {feed.article_limit}")
-            
-            monitor = self.rss_monitors[feed.name]
-            articles = monitor.fetch_latest_articles(feed.article_limit)
-            
+        # Step 2: Fetch RSS articles from all feeds in parallel
+        print("\n📡 Fetching RSS feeds...")
+        feeds = self._enabled_feeds
+        with ThreadPoolExecutor(max_workers=max(len(feeds), 1)) as executor:
+            feed_articles = list(executor.map(
+                lambda feed: self.rss_monitors[feed.name].fetch_latest_articles(feed.article_limit),
+                feeds
+            ))
+        
+        for feed, articles in zip(feeds, feed_articles):
             if articles:
-                print(f"✅ Found {len(articles)} articles from {feed.name}")
+                print(f"📡 {feed.name}: {len(articles)}/{feed.article_limit} articles ({feed.url})")
                 # Add source information to each article
                 for article in articles:
                     article.source = feed.name
@@ -104,10 +175,21 @@ class ContentPipeline:
             print("❌ No articles found from any feed. Exiting.")
             return False
         
+        # Drop stories that appear more than once so each is scraped only once
+        unique_articles = deduplicate_articles(all_articles)
+        if len(unique_articles) < len(all_articles):
+            print(f"\n🔁 Skipped {len(all_articles) - len(unique_articles)} duplicate articles")
+        all_articles = unique_articles
+        
         print(f"\n📊 Total articles collected: {len(all_articles)}")
         
         # Step 3: Scrape full content
         print(f"\n🕷️ Scraping full article content using {self.scraping_strategy} strategy...")
+        # Read the current sheet state in the background while scraping
+        sheets_executor = ThreadPoolExecutor(max_workers=1)
+        sheets_state = sheets_executor.submit(self.sheets_manager.prepare_save_all)
+        sheets_executor.shutdown(wait=False)
+        
         scraped_articles = self.web_scraper.scrape_articles(all_articles)
         print("✅ Content scraping completed")
         
@@ -145,26 +227,18 @@ class ContentPipeline:
         print("\n📊 Saving results to Google Sheets...")
         success = True
         
-        # Save articles
-        if not self.sheets_manager.save_articles(scraped_articles):
-            print("⚠️ Failed to save articles")
-            success = False
-        else:
-            print("✅ Articles saved successfully")
-        
-        # Save content ideas
-        if not self.sheets_manager.save_content_ideas(content_ideas):
-            print("⚠️ Failed to save content ideas")
-            success = False
-        else:
-            print("✅ Content ideas saved successfully")
+        # Save articles, content ideas and summary report in one batched write
+        try:
+            prepared = sheets_state.result()
+        except Exception as e:
+            logger.warning(f"Reading sheet state failed, retrying during save: {e}")
+            prepared = None
         
-        # Save summary report
-        if not self.sheets_manager.save_summary_report(scraped_articles, content_ideas):
-            print("⚠️ Failed to save summary report")
+        if not self.sheets_manager.save_all(scraped_articles, content_ideas, prepared=prepared):
+            print("⚠️ Failed to save some results")
             success = False
         else:
-            print("✅ Summary report saved successfully")
+            print("✅ Articles, content ideas and summary report saved successfully")
         
         if success:
             print("\n🎉 Content pipeline completed successfully!")
@@ -175,15 +249,22 @@ class ContentPipeline:
         
         # Clean up
         self.web_scraper.close()
+        self.feed_session.close()
         
         return success
     
     def _test_connections(self) -> bool:
         """Test all external connections."""
-        # Test RSS feeds
-        for feed in self.config.get_enabled_feeds():
-            monitor = self.rss_monitors[feed.name]
-            if not monitor.is_feed_accessible():
+        # Test RSS feeds in parallel
+        feeds = self._enabled_feeds
+        with ThreadPoolExecutor(max_workers=max(len(feeds), 1)) as executor:
+            accessible = list(executor.map(
+                lambda feed: self.rss_monitors[feed.name].is_feed_accessible(),
+                feeds
+            ))
+        
+        for feed, is_accessible in zip(feeds, accessible):
+            if not is_accessible:
                 print(f"❌ RSS feed '{feed.name}' is not accessible: {feed.url}")
                 return False
             print(f"✅ RSS feed '{feed.name}' is accessible")
@@ -202,12 +283,9 @@ class ContentPipeline:
         print("="*60)
         
         # Group articles by source
-        articles_by_source = {}
+        articles_by_source = defaultdict(list)
         for article in articles:
-            source = getattr(article, 'source', 'Unknown')
-            if source not in articles_by_source:
-                articles_by_source[source] = []
-            articles_by_source[source].append(article)
+            articles_by_source[article.source].append(article)
         
         # Print summary for each source
         for source, source_articles in articles_by_source.items():
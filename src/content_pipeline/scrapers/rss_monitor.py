@@ -1,41 +1,203 @@
 """RSS feed monitoring and article extraction."""
 
+import base64
+import json
+import logging
+import os
+import threading
+
 import feedparser
 import requests
 from datetime import datetime, timezone
-from typing import List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 from ..core.models import Article, SourceFeed
 
+logger = logging.getLogger(__name__)
+
+# Headers sent with every feed request
+FEED_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; ContentPipeline/1.0)',
+    'Accept': 'application/rss+xml, application/xml, text/xml, */*',
+}
+
+# Known article hosts and the feed they belong to
+_SOURCE_FEED_BY_HOST = {
+    'www.freightwaves.com': SourceFeed.FREIGHT_WAVES,
+    'freightwaves.com': SourceFeed.FREIGHT_WAVES,
+    'www.freightcaviar.com': SourceFeed.FREIGHT_CAVIAR,
+    'freightcaviar.com': SourceFeed.FREIGHT_CAVIAR,
+}
+
+
+def _source_feed_for_url(url: str) -> SourceFeed:
+    """Determine the source feed an article URL belongs to.
+    
+    Args:
+        url: Article URL
+        
+    Returns:
+        Matching SourceFeed, or SourceFeed.CUSTOM for unknown sites
+    """
+    host = urlparse(url).netloc.lower()
+    source_feed = _SOURCE_FEED_BY_HOST.get(host)
+    if source_feed is not None:
+        return source_feed
+    
+    # Fall back to a substring match for other subdomains and mirrors
+    url = url.lower()
+    if 'freightwaves' in url:
+        return SourceFeed.FREIGHT_WAVES
+    if 'freightcaviar' in url:
+        return SourceFeed.FREIGHT_CAVIAR
+    return SourceFeed.CUSTOM
+
+
+class FeedCache:
+    """On-disk store of feed bodies and their HTTP validators (ETag/Last-Modified).
+    
+    Lets RSSMonitor send conditional GETs between pipeline runs and reuse the
+    stored body when the server answers 304 Not Modified. Safe to share between
+    monitors fetching on different threads.
+    """
+    
+    def __init__(self, path: str):
+        """Initialize the cache, loading any existing entries.
+        
+        Args:
+            path: JSON file holding the cache entries keyed by feed URL
+        """
+        self.path = Path(path).expanduser()
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable feed cache {self.path}: {e}")
+    
+    def get(self, feed_url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a feed, if any."""
+        with self._lock:
+            return self._entries.get(feed_url)
+    
+    def validator_headers(self, feed_url: str) -> Dict[str, str]:
+        """Return conditional-request headers for a feed's cached entry."""
+        entry = self.get(feed_url) or {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def body(self, feed_url: str) -> Optional[bytes]:
+        """Return the cached feed body, if any."""
+        entry = self.get(feed_url)
+        return base64.b64decode(entry['content']) if entry else None
+    
+    def store(self, feed_url: str, response: requests.Response):
+        """Remember a feed response if the server sent validators for it.
+        
+        Args:
+            feed_url: Feed URL the response belongs to
+            response: Successful (200) feed response
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        entry = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_type': response.headers.get('Content-Type', ''),
+            'content': base64.b64encode(response.content).decode('ascii'),
+        }
+        with self._lock:
+            self._entries[feed_url] = entry
+            self._save()
+    
+    def _save(self):
+        """Write all entries to disk atomically; caller holds the lock."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write feed cache {self.path}: {e}")
+
 
 class RSSMonitor:
     """Monitors RSS feeds and extracts article information."""
     
-    def __init__(self, feed_url: str, timeout: int = 10):
+    def __init__(self, feed_url: str, timeout: int = 10,
+                 session: Optional[requests.Session] = None,
+                 feed_cache: Optional[FeedCache] = None):
         """Initialize RSS monitor.
         
         Args:
             feed_url: URL of the RSS feed to monitor
             timeout: Request timeout in seconds
+            session: Optional shared session so connections are pooled across monitors
+            feed_cache: Optional cache enabling conditional GETs between runs
         """
         self.feed_url = feed_url
         self.timeout = timeout
+        self.session = session or requests.Session()
+        self.feed_cache = feed_cache
+        
+        # Feed parsed by is_feed_accessible(), reused by the next fetch
+        self._cached_feed = None
+    
+    def _parse_feed(self):
+        """Download the feed over the session and parse it with feedparser."""
+        request_headers = dict(FEED_REQUEST_HEADERS)
+        if self.feed_cache:
+            request_headers.update(self.feed_cache.validator_headers(self.feed_url))
+        
+        response = self.session.get(
+            self.feed_url, timeout=self.timeout, headers=request_headers
+        )
+        
+        # feedparser expects lowercase header names; content-location lets it
+        # resolve relative entry links as it does when fetching the URL itself
+        headers = {name.lower(): value for name, value in response.headers.items()}
+        headers['content-location'] = response.url
+        
+        if response.status_code == 304 and self.feed_cache:
+            # Unchanged since the last run: parse the stored body
+            content = self.feed_cache.body(self.feed_url)
+            if content is not None:
+                headers['content-type'] = self.feed_cache.get(self.feed_url)['content_type']
+                return feedparser.parse(content, response_headers=headers)
+        
+        response.raise_for_status()
+        if self.feed_cache and response.status_code == 200:
+            self.feed_cache.store(self.feed_url, response)
+        return feedparser.parse(response.content, response_headers=headers)
     
     def is_feed_accessible(self) -> bool:
         """Test if the RSS feed is accessible.
         
+        The downloaded feed is kept so the next fetch_latest_articles() call
+        doesn't request it again.
+        
         Returns:
             True if feed is accessible, False otherwise
         """
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (compatible; ContentPipeline/1.0)',
-                'Accept': 'application/rss+xml, application/xml, text/xml, */*',
-            }
-            response = requests.get(self.feed_url, timeout=self.timeout, headers=headers)
-            return response.status_code == 200
+            self._cached_feed = self._parse_feed()
+            return True
         except Exception:
+            self._cached_feed = None
             return False
     
     def fetch_latest_articles(self, limit: int = 5) -> List[Article]:
@@ -48,11 +210,10 @@ class RSSMonitor:
             List of Article objects
         """
         try:
-            # Set user agent for feedparser for better compatibility
-            feedparser.USER_AGENT = "Mozilla/5.0 (compatible; ContentPipeline/1.0)"
-            
-            # Parse the RSS feed
-            feed = feedparser.parse(self.feed_url)
+            # Reuse the feed downloaded by is_feed_accessible() once, else fetch it
+            feed, self._cached_feed = self._cached_feed, None
+            if feed is None:
+                feed = self._parse_feed()
             
             if not feed.entries:
                 return []
@@ -80,43 +241,29 @@ class RSSMonitor:
         """
         try:
             # Extract basic information
-            title = getattr(entry, 'title', 'No Title')
-            url = getattr(entry, 'link', '')
+            title = entry.get('title', 'No Title')
+            url = entry.get('link', '')
             
             # Parse published date
             published_date = datetime.now(timezone.utc)
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                try:
-                    published_date = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-                except (TypeError, ValueError):
-                    pass
-            elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
+            date_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+            if date_parsed:
                 try:
-                    published_date = datetime(*entry.updated_parsed[:6], tzinfo=timezone.utc)
+                    published_date = datetime(*date_parsed[:6], tzinfo=timezone.utc)
                 except (TypeError, ValueError):
                     pass
             
             # Extract summary/description
-            description = ''
-            if hasattr(entry, 'summary'):
-                description = entry.summary
-            elif hasattr(entry, 'description'):
-                description = entry.description
+            description = entry.get('summary', entry.get('description', ''))
             
             # Extract author
-            author = getattr(entry, 'author', '')
+            author = entry.get('author', '')
             
             # Extract categories/tags
-            categories = []
-            if hasattr(entry, 'tags'):
-                categories = [tag.term for tag in entry.tags if hasattr(tag, 'term')]
+            categories = [tag['term'] for tag in entry.get('tags', ()) if 'term' in tag]
             
             # Determine source feed from URL
-            source_feed = SourceFeed.CUSTOM
-            if 'freightwaves' in url.lower():
-                source_feed = SourceFeed.FREIGHT_WAVES
-            elif 'freightcaviar' in url.lower():
-                source_feed = SourceFeed.FREIGHT_CAVIAR
+            source_feed = _source_feed_for_url(url)
             
             return Article(
                 title=title,
@@ -139,7 +286,7 @@ class RSSMonitor:
             Dictionary containing feed metadata
         """
         try:
-            feed = feedparser.parse(self.feed_url)
+            feed = self._parse_feed()
             
             return {
                 'title': getattr(feed.feed, 'title', 'Unknown Feed'),
@@ -7,18 +7,25 @@ that eliminates special cases and provides a clean interface for web scraping.
 import logging
 import random
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
 from typing import Dict, List, Optional, Any, Callable, Tuple
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from content_pipeline.core.models import Article
 
 logger = logging.getLogger(__name__)
 
+# Every selector _extract_content uses matches inside <body>, so <head>
+# (meta tags, inline scripts and styles) doesn't need to be parsed
+BODY_STRAINER = SoupStrainer('body')
+_BODY_TAG_RE = re.compile(r'<body[\s>]', re.IGNORECASE)
+
 
 class ScrapingStrategy(Enum):
     """Available scraping strategies."""
@@ -67,7 +74,8 @@ class WebScraper:
                  delay: float = 1.0,
                  timeout: int = 10,
                  max_retries: int = 3,
-                 mcp_functions: Optional[Dict[str, Callable]] = None):
+                 mcp_functions: Optional[Dict[str, Callable]] = None,
+                 max_workers: int = 1):
         """Initialize the scraper.
         
         Args:
@@ -76,12 +84,14 @@ class WebScraper:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
             mcp_functions: Optional MCP functions for Playwright strategy
+            max_workers: Number of articles scraped concurrently (1 = sequential)
         """
         self.strategy = strategy
         self.delay = delay
         self.timeout = timeout
         self.max_retries = max_retries
         self.mcp_functions = mcp_functions or {}
+        self.max_workers = max(1, max_workers)
         
         # Initialize session
         self.session = self._create_session()
@@ -98,6 +108,12 @@ class WebScraper:
             'total_confidence': 0.0,
             'failure_reasons': {}
         }
+        # Guards self.stats when articles are scraped from worker threads
+        self._stats_lock = threading.Lock()
+        
+        # Earliest start time of the next request to each host (concurrent scraping)
+        self._next_request_at: Dict[str, float] = {}
+        self._pacing_lock = threading.Lock()
     
     def _create_session(self) -> requests.Session:
         """Create and configure a requests session."""
@@ -113,6 +129,23 @@ class WebScraper:
         })
         return session
     
+    def _record_stats(self, *counters: str, confidence: float = 0.0,
+                      failure_reason: Optional[str] = None):
+        """Update scraping statistics atomically.
+        
+        Args:
+            *counters: Names of the counters to increment
+            confidence: Confidence to add to the running total
+            failure_reason: Failure reason to count, if any
+        """
+        with self._stats_lock:
+            for counter in counters:
+                self.stats[counter] += 1
+            self.stats['total_confidence'] += confidence
+            if failure_reason:
+                reasons = self.stats['failure_reasons']
+                reasons[failure_reason] = reasons.get(failure_reason, 0) + 1
+    
     def scrape_article(self, article: Article) -> Article:
         """Scrape a single article with RSS fallback.
         
@@ -122,7 +155,7 @@ class WebScraper:
         Returns:
             Updated Article object with scraped content or RSS fallback
         """
-        self.stats['total'] += 1
+        self._record_stats('total')
         
         try:
             # Apply delay
@@ -138,18 +171,17 @@ class WebScraper:
                 article.scraping_strategy = self.strategy
                 article.extraction_confidence = confidence
                 article.failure_reason = ""
-                self.stats['success'] += 1
                 
                 # Track confidence levels
-                self.stats['total_confidence'] += confidence
                 if confidence >= 0.7:
-                    self.stats['high_confidence'] += 1
+                    level = 'high_confidence'
                 elif confidence >= 0.4:
-                    self.stats['medium_confidence'] += 1
+                    level = 'medium_confidence'
                 else:
-                    self.stats['low_confidence'] += 1
+                    level = 'low_confidence'
+                self._record_stats('success', level, confidence=confidence)
                 
-                logger.info(f"Successfully scraped full content (confidence {confidence:.2f}): {article.title[:50]}")
+                logger.debug(f"Successfully scraped full content (confidence {confidence:.2f}): {article.title[:50]}")
             elif hasattr(article, 'description') and article.description:
                 # Fallback to RSS description
                 article.content = article.description
@@ -157,10 +189,7 @@ class WebScraper:
                 article.scraping_strategy = ScrapingStrategy.RSS_FALLBACK
                 article.extraction_confidence = 0.3  # Low confidence for RSS fallback
                 article.failure_reason = "Content extraction failed, using RSS description"
-                self.stats['success'] += 1
-                self.stats['rss_fallback'] += 1
-                self.stats['low_confidence'] += 1
-                self.stats['total_confidence'] += 0.3
+                self._record_stats('success', 'rss_fallback', 'low_confidence', confidence=0.3)
                 logger.warning(f"Using RSS description as fallback: {article.title[:50]}")
             else:
                 # Complete failure - no content and no description
@@ -169,23 +198,19 @@ class WebScraper:
                 article.scraping_strategy = ScrapingStrategy.NONE
                 article.extraction_confidence = 0.0
                 article.failure_reason = "No content extracted and no RSS description available"
-                self.stats['failed'] += 1
                 
                 # Track failure reason
-                reason = "No RSS fallback"
-                self.stats['failure_reasons'][reason] = self.stats['failure_reasons'].get(reason, 0) + 1
+                self._record_stats('failed', failure_reason="No RSS fallback")
                 
                 logger.error(f"No content extracted and no RSS fallback: {article.title[:50]}")
                 
         except Exception as e:
             # Handle exceptions with fallback
-            self.stats['failed'] += 1
             error_msg = str(e)
             logger.error(f"Scraping failed for {article.url}: {error_msg}")
             
             # Track failure reason
-            error_type = type(e).__name__
-            self.stats['failure_reasons'][error_type] = self.stats['failure_reasons'].get(error_type, 0) + 1
+            self._record_stats('failed', failure_reason=type(e).__name__)
             
             # Try RSS fallback even on exception
             if hasattr(article, 'description') and article.description:
@@ -194,9 +219,7 @@ class WebScraper:
                 article.scraping_strategy = ScrapingStrategy.RSS_FALLBACK
                 article.extraction_confidence = 0.3
                 article.failure_reason = f"Scraping error: {error_msg[:200]}, using RSS fallback"
-                self.stats['rss_fallback'] += 1
-                self.stats['low_confidence'] += 1
-                self.stats['total_confidence'] += 0.3
+                self._record_stats('rss_fallback', 'low_confidence', confidence=0.3)
                 logger.warning(f"Using RSS fallback after error: {article.title[:50]}")
             else:
                 article.content = ""
@@ -218,19 +241,78 @@ class WebScraper:
         """
         logger.info(f"Scraping {len(articles)} articles with {self.strategy.value} strategy")
         
-        scraped = []
-        for i, article in enumerate(articles, 1):
-            logger.info(f"Progress: {i}/{len(articles)}")
-            scraped.append(self.scrape_article(article))
-            
-            # Add random delay between articles
-            if i < len(articles):
-                delay = random.uniform(self.delay, self.delay * 2)
-                time.sleep(delay)
+        # The MCP browser is a single shared page, so it always runs sequentially
+        workers = 1 if self.strategy == ScrapingStrategy.MCP_PLAYWRIGHT else self.max_workers
+        if workers > 1 and len(articles) > 1:
+            scraped = self._scrape_concurrently(articles, workers)
+        else:
+            scraped = []
+            for i, article in enumerate(articles, 1):
+                logger.debug(f"Progress: {i}/{len(articles)}")
+                scraped.append(self.scrape_article(article))
+                
+                # Add random delay between articles
+                if i < len(articles):
+                    delay = random.uniform(self.delay, self.delay * 2)
+                    time.sleep(delay)
         
         self._log_stats()
         return scraped
     
+    def _wait_for_host(self, url: str):
+        """Block until the next request to ``url``'s host may start.
+        
+        Request starts to the same host are spaced by a random
+        ``delay``-``2 * delay`` gap, matching the pause the sequential loop
+        takes between articles. Different hosts are not throttled against
+        each other.
+        
+        Args:
+            url: URL about to be requested
+        """
+        host = urlparse(url).netloc.lower()
+        with self._pacing_lock:
+            start = max(time.monotonic(), self._next_request_at.get(host, 0.0))
+            self._next_request_at[host] = start + random.uniform(self.delay, self.delay * 2)
+        
+        wait = start - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+    
+    def _scrape_paced(self, article: Article) -> Article:
+        """Scrape an article once its host's pacing slot comes up."""
+        self._wait_for_host(article.url)
+        return self.scrape_article(article)
+    
+    def _scrape_concurrently(self, articles: List[Article], workers: int) -> List[Article]:
+        """Scrape articles on a thread pool, preserving input order.
+        
+        Workers overlap requests to different hosts, but request starts to the
+        same host are spaced like the sequential loop (see _wait_for_host), so
+        the per-host request rate doesn't grow with ``workers``. The workers
+        share ``self.session``; its connection pool is thread-safe and request
+        headers are passed per call.
+        
+        Args:
+            articles: List of Article objects to scrape
+            workers: Number of worker threads
+            
+        Returns:
+            List of updated Article objects in the same order as ``articles``
+        """
+        scraped: List[Optional[Article]] = [None] * len(articles)
+        
+        with ThreadPoolExecutor(max_workers=min(workers, len(articles))) as executor:
+            futures = {
+                executor.submit(self._scrape_paced, article): index
+                for index, article in enumerate(articles)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                scraped[futures[future]] = future.result()
+                logger.debug(f"Progress: {done}/{len(articles)}")
+        
+        return scraped
+    
     def _scrape_with_strategy(self, url: str) -> Tuple[str, float]:
         """Scrape content using the configured strategy.
         
@@ -270,14 +352,15 @@ class WebScraper:
     
     def _scrape_enhanced(self, url: str) -> Tuple[str, float]:
         """Enhanced scraping with user-agent rotation."""
-        # Rotate user agent
-        self.session.headers['User-Agent'] = random.choice(self.USER_AGENTS)
-        
-        # Add referer for better success rate
+        # Rotate user agent and add referer for better success rate; passed
+        # per request so concurrent scrapes don't overwrite each other's headers
         domain = urlparse(url).netloc
-        self.session.headers['Referer'] = f"https://{domain}/"
+        headers = {
+            'User-Agent': random.choice(self.USER_AGENTS),
+            'Referer': f"https://{domain}/"
+        }
         
-        response = self.session.get(url, timeout=self.timeout)
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
         response.raise_for_status()
         return self._extract_content(response.text)
     
@@ -338,7 +421,9 @@ class WebScraper:
         Returns:
             Tuple of (extracted text content, confidence score 0.0-1.0)
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        # Fragments without a <body> tag are parsed whole
+        parse_only = BODY_STRAINER if _BODY_TAG_RE.search(html) else None
+        soup = BeautifulSoup(html, 'html.parser', parse_only=parse_only)
         confidence = 0.0
         
         # First, check if this is a paywalled or gated content page
@@ -484,7 +569,8 @@ class WebScraper:
         Returns:
             Dictionary of statistics
         """
-        return self.stats.copy()
+        with self._stats_lock:
+            return self.stats.copy()
     
     def close(self):
         """Clean up resources."""
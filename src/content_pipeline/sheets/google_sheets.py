@@ -2,12 +2,12 @@
 
 import json
 import logging
-import time
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
 import gspread
 from google.oauth2.service_account import Credentials
+from gspread.utils import absolute_range_name, rowcol_to_a1
 
 from ..core.models import Article, ContentIdea, SummaryReport
 from .formatting import SheetFormatter
@@ -198,13 +198,7 @@ class GoogleSheetsManager:
                         new_rows.append(row)
                 
                 # Perform batch updates
-                for row_num, row_data in updates:
-                    try:
-                        cell_range = f'A{row_num}:{chr(65 + len(headers) - 1)}{row_num}'
-                        worksheet.update(cell_range, [row_data], value_input_option='USER_ENTERED')
-                        time.sleep(0.1)  # Rate limiting
-                    except Exception as e:
-                        print(f"Warning: Failed to update row {row_num}: {e}")
+                self._update_rows(worksheet, updates, len(headers))
                 
                 # Append new articles
                 if new_rows:
@@ -242,10 +236,7 @@ class GoogleSheetsManager:
                     SheetFormatter.ensure_filter_includes_new_data(worksheet, len(rows))
             
             # Format headers
-            worksheet.format('1:1', {
-                'backgroundColor': {'red': 0.2, 'green': 0.5, 'blue': 0.8},
-                'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
-            })
+            self._format_table_headers(worksheet)
             
             # Apply column widths
             SheetFormatter.auto_resize_columns(worksheet, 'articles')
@@ -314,13 +305,7 @@ class GoogleSheetsManager:
                         new_rows.append(row)
                 
                 # Perform updates
-                for row_num, row_data in updates:
-                    try:
-                        cell_range = f'A{row_num}:{chr(65 + len(headers) - 1)}{row_num}'
-                        worksheet.update(cell_range, [row_data], value_input_option='USER_ENTERED')
-                        time.sleep(0.1)
-                    except Exception as e:
-                        print(f"Warning: Failed to update row {row_num}: {e}")
+                self._update_rows(worksheet, updates, len(headers))
                 
                 if new_rows:
                     worksheet.append_rows(new_rows, value_input_option='USER_ENTERED')
@@ -346,10 +331,7 @@ class GoogleSheetsManager:
                 SheetFormatter.ensure_filter_includes_new_data(worksheet, total_rows)
             
             # Format headers
-            worksheet.format('1:1', {
-                'backgroundColor': {'red': 0.2, 'green': 0.5, 'blue': 0.8},
-                'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
-            })
+            self._format_table_headers(worksheet)
             
             # Apply column widths
             SheetFormatter.auto_resize_columns(worksheet, 'ideas')
@@ -383,36 +365,7 @@ class GoogleSheetsManager:
             return False
         
         try:
-            # Calculate statistics
-            total_articles = len(articles)
-            scraped_successfully = sum(1 for a in articles if a.scraping_success)
-            
-            # Calculate per-feed statistics
-            feed_stats = {}
-            for article in articles:
-                feed_name = article.source_feed.value if hasattr(article.source_feed, 'value') else str(article.source_feed)
-                if feed_name not in feed_stats:
-                    feed_stats[feed_name] = {
-                        "total": 0,
-                        "scraped": 0,
-                        "failed": 0
-                    }
-                feed_stats[feed_name]["total"] += 1
-                if article.scraping_success:
-                    feed_stats[feed_name]["scraped"] += 1
-                else:
-                    feed_stats[feed_name]["failed"] += 1
-            
-            # Create summary report object
-            report = SummaryReport(
-                run_date=datetime.now(),
-                total_articles_fetched=total_articles,
-                articles_scraped_successfully=scraped_successfully,
-                ideas_generated=len(ideas),
-                processing_time_seconds=processing_time,
-                errors=errors or [],
-                feed_statistics=feed_stats
-            )
+            report = self._build_summary_report(articles, ideas, processing_time, errors)
             
             # Get or create Summary Report worksheet
             worksheet = self._get_or_create_worksheet("Summary Report")
@@ -425,11 +378,7 @@ class GoogleSheetsManager:
                 existing_data = worksheet.get_all_values()
                 if not existing_data:
                     worksheet.append_row(headers)
-                    # Format headers
-                    worksheet.format('1:1', {
-                        'backgroundColor': {'red': 0.2, 'green': 0.6, 'blue': 0.9},
-                        'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
-                    })
+                    self._format_summary_headers(worksheet)
             except:
                 worksheet.append_row(headers)
             
@@ -449,6 +398,219 @@ class GoogleSheetsManager:
             print(f"Error saving summary report: {e}")
             return False
     
+    def prepare_save_all(self) -> Dict[str, Any]:
+        """Read the sheet state save_all() needs before writing.
+        
+        Looks up (or creates) the output worksheets and reads the existing
+        Articles and Summary Report rows. The pipeline calls this while articles
+        are still being scraped so these round-trips overlap with scraping.
+        
+        Returns:
+            Dictionary with the "worksheets" by title and "existing" sheet values
+        """
+        titles = ["Articles", "Content Ideas", "Summary Report", "Summary"]
+        return {
+            "worksheets": self._get_or_create_worksheets(titles),
+            "existing": self.get_sheet_values(["Articles", "Summary Report"]),
+        }
+    
+    def save_all(
+        self,
+        articles: List[Article],
+        ideas: List[ContentIdea],
+        processing_time: float = 0.0,
+        errors: Optional[List[Dict[str, Any]]] = None,
+        prepared: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Save articles, content ideas and the summary report in one batched write.
+        
+        Produces the same sheets as save_articles (upsert), save_content_ideas
+        (overwrite) and save_summary_report, but reads the existing Articles and
+        Summary Report rows with one values.batchGet and writes every sheet's
+        values with a single values.batchUpdate. Formatting is applied afterwards.
+        
+        Args:
+            articles: List of articles to save
+            ideas: List of content ideas to save
+            processing_time: Time taken to process in seconds
+            errors: List of errors encountered during processing
+            prepared: Sheet state from prepare_save_all(), read now if omitted
+            
+        Returns:
+            True if everything was saved, False otherwise
+        """
+        if not articles or not self.spreadsheet:
+            return False
+        
+        try:
+            if prepared is None:
+                prepared = self.prepare_save_all()
+            worksheets = prepared["worksheets"]
+            existing = prepared["existing"]
+            report = self._build_summary_report(articles, ideas, processing_time, errors)
+            
+            data = []
+            clear_ranges = []
+            required_rows = {}
+            
+            def write(title: str, start_row: int, rows: List[List[Any]]):
+                data.append({
+                    "range": absolute_range_name(title, f"A{start_row}"),
+                    "values": rows
+                })
+                required_rows[title] = max(required_rows.get(title, 0), start_row + len(rows) - 1)
+            
+            # Articles: upsert by URL (column index 1)
+            article_headers = Article.sheet_headers()
+            article_values = existing["Articles"]
+            if not article_values:
+                write("Articles", 1, [article_headers])
+            elif article_values[0] != article_headers:
+                print("Warning: Headers mismatch. Consider running purge script first.")
+            
+            row_numbers = {
+                row[1]: idx
+                for idx, row in enumerate(article_values[1:], start=2)
+                if len(row) > 1
+            }
+            new_rows = []
+            for article in articles:
+                article.updated_at = datetime.now()
+                row = [self._sanitize_for_sheets(v) for v in article.to_sheet_row()]
+                if article.url in row_numbers:
+                    write("Articles", row_numbers[article.url], [row])
+                else:
+                    new_rows.append(row)
+            
+            articles_start = max(len(article_values), 1) + 1
+            if new_rows:
+                write("Articles", articles_start, new_rows)
+            
+            # Content ideas: overwrite the whole sheet
+            if ideas:
+                clear_ranges.append(absolute_range_name("Content Ideas"))
+                idea_rows = [ContentIdea.sheet_headers()]
+                idea_rows.extend(
+                    [self._sanitize_for_sheets(v) for v in idea.to_sheet_row()]
+                    for idea in ideas
+                )
+                write("Content Ideas", 1, idea_rows)
+            
+            # Summary report: append one row, adding headers to an empty sheet
+            report_values = existing["Summary Report"]
+            report_row = [self._sanitize_for_sheets(v) for v in report.to_sheet_row()]
+            if report_values:
+                write("Summary Report", len(report_values) + 1, [report_row])
+            else:
+                write("Summary Report", 1, [SummaryReport.sheet_headers(), report_row])
+            
+            # Legacy human-readable summary: overwrite the whole sheet
+            clear_ranges.append(absolute_range_name("Summary"))
+            write("Summary", 1, self._legacy_summary_rows(articles, ideas, report))
+            
+            # values.batchUpdate does not grow the grid, so add rows where needed
+            for title, last_row in required_rows.items():
+                worksheet = worksheets[title]
+                if last_row > worksheet.row_count:
+                    worksheet.add_rows(last_row - worksheet.row_count)
+            
+            self.spreadsheet.values_batch_clear(body={"ranges": clear_ranges})
+            self.spreadsheet.values_batch_update(
+                body={"valueInputOption": "USER_ENTERED", "data": data}
+            )
+            
+            # Formatting is cosmetic; the values are already saved at this point
+            try:
+                worksheet = worksheets["Articles"]
+                if new_rows:
+                    end_row = articles_start + len(new_rows) - 1
+                    SheetFormatter.format_new_rows(worksheet, articles_start, end_row, 'articles')
+                    SheetFormatter.ensure_filter_includes_new_data(worksheet, end_row)
+                self._format_table_headers(worksheet)
+                SheetFormatter.auto_resize_columns(worksheet, 'articles')
+                
+                if ideas:
+                    worksheet = worksheets["Content Ideas"]
+                    total_rows = len(ideas) + 1
+                    SheetFormatter.format_new_rows(worksheet, 2, total_rows, 'ideas')
+                    SheetFormatter.ensure_filter_includes_new_data(worksheet, total_rows)
+                    self._format_table_headers(worksheet)
+                    SheetFormatter.auto_resize_columns(worksheet, 'ideas')
+                
+                if not report_values:
+                    self._format_summary_headers(worksheets["Summary Report"])
+                self._format_legacy_summary(worksheets["Summary"])
+            except Exception as e:
+                logger.warning(f"Saved pipeline results but formatting failed: {e}")
+            
+            if not ideas:
+                print(f"Saved {len(articles)} articles and the summary report to Google Sheets")
+                print("Warning: No content ideas to save")
+                return False
+            
+            print(f"Successfully saved {len(articles)} articles, {len(ideas)} content ideas "
+                  f"and the summary report to Google Sheets")
+            return True
+            
+        except Exception as e:
+            print(f"Error saving pipeline results: {e}")
+            return False
+    
+    def _build_summary_report(
+        self,
+        articles: List[Article],
+        ideas: List[ContentIdea],
+        processing_time: float = 0.0,
+        errors: Optional[List[Dict[str, Any]]] = None
+    ) -> SummaryReport:
+        """Build the summary report for a run from its articles and ideas.
+        
+        Args:
+            articles: List of articles processed
+            ideas: List of content ideas generated
+            processing_time: Time taken to process in seconds
+            errors: List of errors encountered during processing
+            
+        Returns:
+            SummaryReport with overall and per-feed statistics
+        """
+        # Calculate statistics
+        total_articles = len(articles)
+        scraped_successfully = sum(1 for a in articles if a.scraping_success)
+        
+        # Calculate per-feed statistics
+        feed_stats = {}
+        for article in articles:
+            feed_name = article.source_feed.value if hasattr(article.source_feed, 'value') else str(article.source_feed)
+            stats = feed_stats.setdefault(feed_name, {"total": 0, "scraped": 0, "failed": 0})
+            stats["total"] += 1
+            stats["scraped" if article.scraping_success else "failed"] += 1
+        
+        # Create summary report object
+        return SummaryReport(
+            run_date=datetime.now(),
+            total_articles_fetched=total_articles,
+            articles_scraped_successfully=scraped_successfully,
+            ideas_generated=len(ideas),
+            processing_time_seconds=processing_time,
+            errors=errors or [],
+            feed_statistics=feed_stats
+        )
+    
+    def _format_table_headers(self, worksheet):
+        """Apply the header style used by the Articles and Content Ideas sheets."""
+        worksheet.format('1:1', {
+            'backgroundColor': {'red': 0.2, 'green': 0.5, 'blue': 0.8},
+            'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
+        })
+    
+    def _format_summary_headers(self, worksheet):
+        """Apply the header style used by the Summary Report sheet."""
+        worksheet.format('1:1', {
+            'backgroundColor': {'red': 0.2, 'green': 0.6, 'blue': 0.9},
+            'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
+        })
+    
     def _save_legacy_summary(self, articles: List[Article], ideas: List[ContentIdea], report: SummaryReport):
         """Save a human-readable summary for backward compatibility.
         
@@ -461,61 +623,81 @@ class GoogleSheetsManager:
             worksheet = self._get_or_create_worksheet("Summary")
             worksheet.clear()
             
-            # Prepare human-readable summary
-            summary_data = [
-                ["Content Pipeline Summary Report"],
-                [""],
-                ["Run Date:", report.run_date.strftime("%Y-%m-%d %H:%M:%S")],
-                ["Run ID:", report.run_id],
-                [""],
-                ["=== STATISTICS ==="],
-                ["Articles Processed:", report.total_articles_fetched],
-                ["Successfully Scraped:", report.articles_scraped_successfully],
-                ["Success Rate:", f"{report.scraping_success_rate:.1f}%"],
-                ["Content Ideas Generated:", report.ideas_generated],
-                ["Processing Time:", f"{report.processing_time_seconds:.2f} seconds"],
-                [""],
-                ["=== FEED BREAKDOWN ==="]
-            ]
-            
-            # Add feed statistics
-            for feed, stats in report.feed_statistics.items():
-                summary_data.append([f"{feed}:", f"Total: {stats['total']}, Scraped: {stats['scraped']}, Failed: {stats['failed']}"])
-            
-            summary_data.append([""])
-            summary_data.append(["=== TOP ARTICLES ==="])
-            
-            # Add top 10 articles
-            for i, article in enumerate(articles[:10], 1):
-                summary_data.append([f"{i}. {article.title[:100]}", article.url])
-            
-            if ideas:
-                summary_data.append([""])
-                summary_data.append(["=== CONTENT IDEAS GENERATED ==="])
-                
-                # Add all content ideas
-                for i, idea in enumerate(ideas, 1):
-                    summary_data.append([f"{i}. {idea.idea_title}", idea.content_type.value if hasattr(idea.content_type, 'value') else str(idea.content_type)])
-            
             # Update worksheet
-            worksheet.update(summary_data, value_input_option='USER_ENTERED')
-            
-            # Format title
-            worksheet.format('1:1', {
-                'backgroundColor': {'red': 0.2, 'green': 0.6, 'blue': 0.9},
-                'textFormat': {'bold': True, 'fontSize': 16, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
-            })
+            worksheet.update(
+                self._legacy_summary_rows(articles, ideas, report),
+                value_input_option='USER_ENTERED'
+            )
+            self._format_legacy_summary(worksheet)
             
-            # Format section headers
-            for row_num in [6, 13]:  # Adjust based on actual row numbers
-                try:
-                    worksheet.format(f'{row_num}:{row_num}', {'textFormat': {'bold': True}})
-                except:
-                    pass
-                    
         except Exception as e:
             print(f"Warning: Could not save legacy summary: {e}")
     
+    def _legacy_summary_rows(self, articles: List[Article], ideas: List[ContentIdea],
+                             report: SummaryReport) -> List[List[Any]]:
+        """Build the rows of the human-readable "Summary" sheet.
+        
+        Args:
+            articles: List of articles processed
+            ideas: List of content ideas generated
+            report: The summary report object
+            
+        Returns:
+            Rows to write starting at A1
+        """
+        # Prepare human-readable summary
+        summary_data = [
+            ["Content Pipeline Summary Report"],
+            [""],
+            ["Run Date:", report.run_date.strftime("%Y-%m-%d %H:%M:%S")],
+            ["Run ID:", report.run_id],
+            [""],
+            ["=== STATISTICS ==="],
+            ["Articles Processed:", report.total_articles_fetched],
+            ["Successfully Scraped:", report.articles_scraped_successfully],
+            ["Success Rate:", f"{report.scraping_success_rate:.1f}%"],
+            ["Content Ideas Generated:", report.ideas_generated],
+            ["Processing Time:", f"{report.processing_time_seconds:.2f} seconds"],
+            [""],
+            ["=== FEED BREAKDOWN ==="]
+        ]
+        
+        # Add feed statistics
+        for feed, stats in report.feed_statistics.items():
+            summary_data.append([f"{feed}:", f"Total: {stats['total']}, Scraped: {stats['scraped']}, Failed: {stats['failed']}"])
+        
+        summary_data.append([""])
+        summary_data.append(["=== TOP ARTICLES ==="])
+        
+        # Add top 10 articles
+        for i, article in enumerate(articles[:10], 1):
+            summary_data.append([f"{i}. {article.title[:100]}", article.url])
+        
+        if ideas:
+            summary_data.append([""])
+            summary_data.append(["=== CONTENT IDEAS GENERATED ==="])
+            
+            # Add all content ideas
+            for i, idea in enumerate(ideas, 1):
+                summary_data.append([f"{i}. {idea.idea_title}", idea.content_type.value if hasattr(idea.content_type, 'value') else str(idea.content_type)])
+        
+        return summary_data
+    
+    def _format_legacy_summary(self, worksheet):
+        """Style the title and section headers of the "Summary" sheet."""
+        # Format title
+        worksheet.format('1:1', {
+            'backgroundColor': {'red': 0.2, 'green': 0.6, 'blue': 0.9},
+            'textFormat': {'bold': True, 'fontSize': 16, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
+        })
+        
+        # Format section headers
+        for row_num in [6, 13]:  # Adjust based on actual row numbers
+            try:
+                worksheet.format(f'{row_num}:{row_num}', {'textFormat': {'bold': True}})
+            except:
+                pass
+    
     def _get_or_create_worksheet(self, title: str):
         """Get existing worksheet or create new one.
         
@@ -532,6 +714,69 @@ class GoogleSheetsManager:
             # Create new worksheet
             return self.spreadsheet.add_worksheet(title=title, rows=1000, cols=20)
     
+    def _get_or_create_worksheets(self, titles: List[str]) -> Dict[str, Any]:
+        """Get several worksheets with one metadata call, creating any missing.
+        
+        Args:
+            titles: Worksheet titles
+            
+        Returns:
+            Dictionary mapping each title to its worksheet object
+        """
+        worksheets = {ws.title: ws for ws in self.spreadsheet.worksheets()}
+        for title in titles:
+            if title not in worksheets:
+                worksheets[title] = self.spreadsheet.add_worksheet(title=title, rows=1000, cols=20)
+        return {title: worksheets[title] for title in titles}
+    
+    def _update_rows(self, worksheet, updates: List[tuple], width: int):
+        """Overwrite several existing rows with a single values.batchUpdate call.
+        
+        Args:
+            worksheet: Worksheet containing the rows
+            updates: List of (row_number, row_values) tuples
+            width: Number of columns to write
+        """
+        if not updates:
+            return
+        
+        data = [
+            {
+                "range": absolute_range_name(
+                    worksheet.title, f'A{row_num}:{rowcol_to_a1(row_num, width)}'
+                ),
+                "values": [row_data]
+            }
+            for row_num, row_data in updates
+        ]
+        try:
+            self.spreadsheet.values_batch_update(
+                body={"valueInputOption": "USER_ENTERED", "data": data}
+            )
+        except Exception as e:
+            print(f"Warning: Failed to update {len(updates)} existing rows: {e}")
+    
+    def get_sheet_values(self, titles: List[str]) -> Dict[str, List[List[str]]]:
+        """Fetch the contents of several worksheets in a single API call.
+        
+        Args:
+            titles: Titles of existing worksheets to read
+            
+        Returns:
+            Dictionary mapping each title to its rows (empty list for empty sheets)
+        """
+        if not titles:
+            return {}
+        
+        response = self.spreadsheet.values_batch_get(
+            [absolute_range_name(title) for title in titles]
+        )
+        value_ranges = response.get("valueRanges", [])
+        return {
+            title: value_range.get("values", [])
+            for title, value_range in zip(titles, value_ranges)
+        }
+    
     def get_spreadsheet_info(self) -> Dict[str, Any]:
         """Get information about the spreadsheet.
         
@@ -650,13 +895,13 @@ class GoogleSheetsManager:
                         field_name = field.replace("_", " ").title()
                         if field_name in headers:
                             col_idx = headers.index(field_name)
-                            cell = f"{chr(65 + col_idx)}{row_num}"
+                            cell = rowcol_to_a1(row_num, col_idx + 1)
                             worksheet.update(cell, self._sanitize_for_sheets(value), value_input_option='USER_ENTERED')
                     
                     # Update the "Updated At" timestamp
                     if "Updated At" in headers:
                         col_idx = headers.index("Updated At")
-                        cell = f"{chr(65 + col_idx)}{row_num}"
+                        cell = rowcol_to_a1(row_num, col_idx + 1)
                         worksheet.update(cell, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), value_input_option='USER_ENTERED')
                     
                     return True
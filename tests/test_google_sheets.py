@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""Test suite for GoogleSheetsManager batched writes."""
+
+import unittest
+from unittest.mock import patch, MagicMock
+from datetime import datetime
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from content_pipeline.sheets.google_sheets import GoogleSheetsManager
+from content_pipeline.core.models import Article, ContentIdea, SummaryReport, SourceFeed, ContentType
+
+
+class TestSaveAll(unittest.TestCase):
+    """Test saving all pipeline results with one values.batchUpdate."""
+    
+    def setUp(self):
+        """Set up a manager backed by a mocked spreadsheet."""
+        with patch.object(GoogleSheetsManager, '_initialize_client'):
+            self.manager = GoogleSheetsManager("credentials.json", "spreadsheet-id")
+        
+        self.worksheets = [
+            self._worksheet("Articles"),
+            self._worksheet("Content Ideas"),
+            self._worksheet("Summary Report"),
+        ]
+        self.spreadsheet = MagicMock()
+        self.spreadsheet.worksheets.return_value = self.worksheets
+        self.spreadsheet.add_worksheet.side_effect = (
+            lambda title, rows, cols: self._worksheet(title, rows)
+        )
+        self.manager.spreadsheet = self.spreadsheet
+        
+        self.existing_article = Article(
+            url="https://example.com/existing",
+            title="Existing Article",
+            published_date=datetime(2024, 1, 15, 10, 30),
+            source_feed=SourceFeed.FREIGHT_WAVES
+        )
+        self.new_article = Article(
+            url="https://example.com/new",
+            title="New Article",
+            published_date=datetime(2024, 1, 16, 10, 30),
+            source_feed=SourceFeed.FREIGHT_CAVIAR
+        )
+        self.ideas = [ContentIdea(idea_title="Freight Outlook", content_type=ContentType.BLOG_POST)]
+        
+        self.spreadsheet.values_batch_get.return_value = {
+            "valueRanges": [
+                {"values": [Article.sheet_headers(), ["id-1", "https://example.com/existing"]]},
+                {},
+            ]
+        }
+    
+    def _worksheet(self, title, row_count=1000):
+        """Return a mocked worksheet with a title and grid size."""
+        worksheet = MagicMock()
+        worksheet.title = title
+        worksheet.row_count = row_count
+        worksheet.col_count = 20
+        return worksheet
+    
+    def _written_ranges(self):
+        """Return the ranges and values sent in the single batch update."""
+        self.spreadsheet.values_batch_update.assert_called_once()
+        body = self.spreadsheet.values_batch_update.call_args.kwargs["body"]
+        self.assertEqual(body["valueInputOption"], "USER_ENTERED")
+        return {entry["range"]: entry["values"] for entry in body["data"]}
+    
+    def test_save_all_writes_every_sheet_in_one_call(self):
+        """Test that upserts, appends and rewrites share one batch update."""
+        with patch('content_pipeline.sheets.google_sheets.SheetFormatter'):
+            result = self.manager.save_all([self.existing_article, self.new_article], self.ideas)
+        
+        self.assertTrue(result)
+        written = self._written_ranges()
+        
+        # Existing article updated in place, new article appended after it
+        self.assertEqual(written["'Articles'!A2"][0][1], "https://example.com/existing")
+        self.assertEqual(written["'Articles'!A3"][0][1], "https://example.com/new")
+        
+        # Content ideas rewritten from the header row
+        self.assertEqual(written["'Content Ideas'!A1"][0], ContentIdea.sheet_headers())
+        self.assertEqual(written["'Content Ideas'!A1"][1][1], "Freight Outlook")
+        
+        # Empty summary report sheet gets headers plus the report row
+        self.assertEqual(written["'Summary Report'!A1"][0], SummaryReport.sheet_headers())
+        self.assertEqual(written["'Summary Report'!A1"][1][2], "2")
+        
+        # Missing legacy summary sheet is created and rewritten
+        self.spreadsheet.add_worksheet.assert_called_once_with(title="Summary", rows=1000, cols=20)
+        self.assertIn("'Summary'!A1", written)
+        self.spreadsheet.values_batch_clear.assert_called_once_with(
+            body={"ranges": ["'Content Ideas'", "'Summary'"]}
+        )
+    
+    def test_save_all_grows_full_sheets(self):
+        """Test that rows are added before writing past the end of the grid."""
+        self.worksheets[0].row_count = 2
+        
+        with patch('content_pipeline.sheets.google_sheets.SheetFormatter'):
+            self.manager.save_all([self.existing_article, self.new_article], self.ideas)
+        
+        self.worksheets[0].add_rows.assert_called_once_with(1)
+    
+    def test_save_all_uses_prepared_state(self):
+        """Test that state read ahead of time is not fetched again."""
+        prepared = self.manager.prepare_save_all()
+        self.spreadsheet.values_batch_get.reset_mock()
+        self.spreadsheet.worksheets.reset_mock()
+        
+        with patch('content_pipeline.sheets.google_sheets.SheetFormatter'):
+            result = self.manager.save_all([self.new_article], self.ideas, prepared=prepared)
+        
+        self.assertTrue(result)
+        self.spreadsheet.values_batch_get.assert_not_called()
+        self.spreadsheet.worksheets.assert_not_called()
+        self.assertIn("'Articles'!A3", self._written_ranges())
+    
+    def test_save_all_formatting_failure_still_succeeds(self):
+        """Test that a formatting error after the write doesn't fail the save."""
+        with patch('content_pipeline.sheets.google_sheets.SheetFormatter') as formatter:
+            formatter.format_new_rows.side_effect = Exception("quota exceeded")
+            result = self.manager.save_all([self.new_article], self.ideas)
+        
+        self.assertTrue(result)
+        self._written_ranges()
+    
+    def test_save_all_without_ideas_reports_failure(self):
+        """Test that missing ideas leave the ideas sheet untouched and return False."""
+        with patch('content_pipeline.sheets.google_sheets.SheetFormatter'):
+            result = self.manager.save_all([self.new_article], [])
+        
+        self.assertFalse(result)
+        written = self._written_ranges()
+        self.assertNotIn("'Content Ideas'!A1", written)
+        self.assertIn("'Articles'!A3", written)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""Test suite for IdeaGenerator keyword, theme and idea generation."""
+
+import unittest
+from collections import Counter
+from datetime import datetime
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from content_pipeline.brainstorm.idea_generator import IdeaGenerator
+from content_pipeline.core.models import Article, ContentIdea, SourceFeed, ContentType
+
+
+class TestIdeaGenerator(unittest.TestCase):
+    """Test content idea generation from articles."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.generator = IdeaGenerator()
+        self.article_data = {
+            "published_date": datetime(2024, 1, 15, 10, 30),
+            "source_feed": SourceFeed.FREIGHT_WAVES
+        }
+        self.articles = [
+            Article(
+                url="https://example.com/freight-rates",
+                title="The Freight Rates Report",
+                description="Freight rates climb as shipping demand grows.",
+                content="Shipping companies report freight growth. Freight market data shows growth.",
+                **self.article_data
+            ),
+            Article(
+                url="https://example.com/warehouse-automation",
+                title="Warehouse Automation News",
+                description="Automation software reshapes warehouse operations.",
+                content="Digital platform investment drives warehouse automation and freight delivery.",
+                **self.article_data
+            ),
+        ]
+    
+    def test_count_words_filters_candidates(self):
+        """Test that words are counted and short words and stop words dropped."""
+        counts = self.generator._count_words(self.articles[0])
+        
+        self.assertEqual(counts.most_common(1)[0][0], "freight")
+        self.assertEqual(counts["growth"], 2)
+        # Short words and stop words are dropped
+        self.assertNotIn("as", counts)
+        self.assertNotIn("the", counts)
+    
+    def test_count_words_splits_on_punctuation(self):
+        """Test that punctuation separates words like whitespace does."""
+        article = Article(
+            url="https://example.com/a",
+            title="Cross-border e-commerce, freight's future",
+            **self.article_data
+        )
+        counts = self.generator._count_words(article)
+        
+        self.assertIn("cross", counts)
+        self.assertIn("border", counts)
+        self.assertIn("commerce", counts)
+        self.assertIn("freight", counts)
+        self.assertNotIn("e-commerce", counts)
+    
+    def test_identify_themes(self):
+        """Test that keywords are grouped under matching themes."""
+        counts = sum((self.generator._count_words(a) for a in self.articles), Counter())
+        keywords = [word for word, _ in counts.most_common(50)]
+        themes = self.generator._identify_themes(self.articles, keywords)
+        
+        self.assertIn("logistics", themes)
+        self.assertIn("freight", themes["logistics"])
+        self.assertIn("technology", themes)
+        self.assertIn("automation", themes["technology"])
+    
+    def test_extract_main_topic(self):
+        """Test that leading articles and trailing report words are stripped."""
+        self.assertEqual(self.generator._extract_main_topic("The Freight Rates Report"), "Freight Rates")
+        self.assertEqual(self.generator._extract_main_topic("Warehouse Automation News"), "Warehouse Automation")
+    
+    def test_generate_ideas(self):
+        """Test that generated ideas are unique, capped and sourced."""
+        ideas = self.generator.generate_ideas(self.articles)
+        titles = [idea.idea_title for idea in ideas]
+        
+        self.assertLessEqual(len(ideas), 10)
+        self.assertEqual(len(titles), len(set(titles)))
+        self.assertTrue(all(idea.source_articles for idea in ideas))
+        self.assertTrue(all(isinstance(idea.content_type, ContentType) for idea in ideas))
+        # Ideas are ordered by how many keywords they carry
+        keyword_counts = [len(idea.keywords) for idea in ideas]
+        self.assertEqual(keyword_counts, sorted(keyword_counts, reverse=True))
+    
+    def test_deduplicate_ideas_normalizes_titles(self):
+        """Test that titles differing only in case or punctuation are merged."""
+        first = ContentIdea(
+            idea_title="Understanding Freight Wars",
+            content_type=ContentType.BLOG_POST,
+            keywords=["freight"]
+        )
+        richer = ContentIdea(
+            idea_title="understanding freight wars.",
+            content_type=ContentType.BLOG_POST,
+            keywords=["freight", "rates"]
+        )
+        other = ContentIdea(
+            idea_title="Freight Industry Roundup",
+            content_type=ContentType.NEWSLETTER,
+            keywords=[]
+        )
+        
+        unique = self.generator._deduplicate_ideas([first, other, richer])
+        
+        self.assertEqual(len(unique), 2)
+        self.assertIs(unique[0], richer)
+        self.assertIs(unique[1], other)
+    
+    def test_generate_ideas_empty(self):
+        """Test that no articles produce no ideas."""
+        self.assertEqual(self.generator.generate_ideas([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
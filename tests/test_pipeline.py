@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""Test suite for ContentPipeline helpers."""
+
+import unittest
+from datetime import datetime
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from content_pipeline.main import article_fingerprint, deduplicate_articles
+from content_pipeline.core.models import Article, SourceFeed
+
+
+class TestArticleDeduplication(unittest.TestCase):
+    """Test cross-feed article de-duplication."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.article_data = {
+            "published_date": datetime(2024, 1, 15, 10, 30),
+            "source_feed": SourceFeed.FREIGHT_WAVES
+        }
+    
+    def test_fingerprint_ignores_tracking_and_case(self):
+        """Test that query strings, fragments, case and trailing slashes are ignored."""
+        plain = Article(
+            url="https://www.freightwaves.com/news/rates",
+            title="Freight Rates Climb",
+            **self.article_data
+        )
+        tracked = Article(
+            url="https://WWW.FreightWaves.com/news/rates/?utm_source=rss#top",
+            title=" freight rates climb ",
+            **self.article_data
+        )
+        
+        self.assertEqual(article_fingerprint(plain), article_fingerprint(tracked))
+    
+    def test_fingerprint_distinguishes_titles(self):
+        """Test that different stories behind the same path stay distinct."""
+        first = Article(url="https://example.com/?p=1", title="First Story", **self.article_data)
+        second = Article(url="https://example.com/?p=2", title="Second Story", **self.article_data)
+        
+        self.assertNotEqual(article_fingerprint(first), article_fingerprint(second))
+    
+    def test_deduplicate_keeps_first_occurrence(self):
+        """Test that duplicates are dropped while order is preserved."""
+        first = Article(url="https://example.com/a", title="Story A", **self.article_data)
+        second = Article(url="https://example.com/b", title="Story B", **self.article_data)
+        repeat = Article(url="https://example.com/a?ref=feed", title="Story A", **self.article_data)
+        
+        unique = deduplicate_articles([first, second, repeat])
+        
+        self.assertEqual(len(unique), 2)
+        self.assertIs(unique[0], first)
+        self.assertIs(unique[1], second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""Test suite for RSSMonitor feed fetching and parsing."""
+
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from content_pipeline.scrapers.rss_monitor import RSSMonitor, FeedCache, _source_feed_for_url
+from content_pipeline.core.models import SourceFeed
+
+
+FEED_URL = "https://www.freightwaves.com/feed"
+
+FEED_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>FreightWaves</title>
+    <link>https://www.freightwaves.com/</link>
+    <item>
+      <title>Freight Rates Climb</title>
+      <link>/news/freight-rates-climb</link>
+      <description>Spot rates rose for a third week.</description>
+      <pubDate>Mon, 15 Jan 2024 10:30:00 GMT</pubDate>
+    </item>
+    <item>
+      <title>Warehouse Automation Grows</title>
+      <link>https://www.freightwaves.com/news/warehouse-automation</link>
+      <description>Robotics spending keeps rising.</description>
+    </item>
+  </channel>
+</rss>
+"""
+
+
+class TestRSSMonitor(unittest.TestCase):
+    """Test RSS feed fetching through a shared session."""
+    
+    def _session(self, status_code=200, headers=None):
+        """Return a mocked session whose GET answers with FEED_XML."""
+        response = MagicMock()
+        response.content = FEED_XML if status_code == 200 else b""
+        response.url = FEED_URL
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/rss+xml; charset=utf-8'})
+        response.headers.update(headers or {})
+        if status_code >= 400:
+            response.raise_for_status.side_effect = requests.HTTPError(f"{status_code} Error")
+        
+        session = MagicMock()
+        session.get.return_value = response
+        return session
+    
+    def test_fetch_latest_articles(self):
+        """Test that entries are parsed into articles with absolute URLs."""
+        monitor = RSSMonitor(FEED_URL, session=self._session())
+        articles = monitor.fetch_latest_articles(limit=5)
+        
+        self.assertEqual(len(articles), 2)
+        self.assertEqual(articles[0].url, "https://www.freightwaves.com/news/freight-rates-climb")
+        self.assertEqual(articles[0].title, "Freight Rates Climb")
+        self.assertEqual(articles[0].source_feed, SourceFeed.FREIGHT_WAVES)
+        self.assertEqual(articles[0].published_date.year, 2024)
+    
+    def test_fetch_respects_limit(self):
+        """Test that only the requested number of entries is returned."""
+        monitor = RSSMonitor(FEED_URL, session=self._session())
+        
+        self.assertEqual(len(monitor.fetch_latest_articles(limit=1)), 1)
+    
+    def test_accessibility_check_reuses_download(self):
+        """Test that the feed downloaded by the check serves the next fetch."""
+        session = self._session()
+        monitor = RSSMonitor(FEED_URL, session=session)
+        
+        self.assertTrue(monitor.is_feed_accessible())
+        self.assertEqual(len(monitor.fetch_latest_articles()), 2)
+        self.assertEqual(session.get.call_count, 1)
+        
+        # The cached feed is used once; later fetches download again
+        monitor.fetch_latest_articles()
+        self.assertEqual(session.get.call_count, 2)
+    
+    def test_inaccessible_feed(self):
+        """Test that HTTP errors mark the feed inaccessible and yield no articles."""
+        monitor = RSSMonitor(FEED_URL, session=self._session(status_code=503))
+        
+        self.assertFalse(monitor.is_feed_accessible())
+        self.assertEqual(monitor.fetch_latest_articles(), [])
+    
+    def test_conditional_get_reuses_cached_feed(self):
+        """Test that validators are sent and a 304 is served from the cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = os.path.join(tmpdir, "feeds.json")
+            etag = '"abc123"'
+            
+            # First run stores the body and its ETag
+            first = RSSMonitor(FEED_URL, session=self._session(headers={'ETag': etag}),
+                               feed_cache=FeedCache(cache_path))
+            self.assertEqual(len(first.fetch_latest_articles()), 2)
+            
+            # Next run loads the cache from disk and gets 304 Not Modified
+            session = self._session(status_code=304)
+            second = RSSMonitor(FEED_URL, session=session, feed_cache=FeedCache(cache_path))
+            articles = second.fetch_latest_articles()
+            
+            sent_headers = session.get.call_args.kwargs["headers"]
+            self.assertEqual(sent_headers["If-None-Match"], etag)
+            self.assertEqual(len(articles), 2)
+            self.assertEqual(articles[0].url, "https://www.freightwaves.com/news/freight-rates-climb")
+    
+    def test_source_feed_for_url(self):
+        """Test that article hosts map to their source feed."""
+        self.assertEqual(_source_feed_for_url("https://www.freightwaves.com/news/a"), SourceFeed.FREIGHT_WAVES)
+        self.assertEqual(_source_feed_for_url("https://FreightCaviar.com/story"), SourceFeed.FREIGHT_CAVIAR)
+        self.assertEqual(_source_feed_for_url("https://blog.freightwaves.com/a"), SourceFeed.FREIGHT_WAVES)
+        self.assertEqual(_source_feed_for_url("https://example.com/freight"), SourceFeed.CUSTOM)
+        self.assertEqual(_source_feed_for_url(""), SourceFeed.CUSTOM)
+
+
+if __name__ == "__main__":
+    unittest.main()
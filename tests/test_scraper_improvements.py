@@ -195,6 +195,95 @@ class TestWebScraperImprovements(unittest.TestCase):
         self.assertEqual(stats['success'], 1)
         self.assertEqual(stats['failed'], 0)
     
+    @patch('requests.Session.get')
+    def test_scrape_articles_concurrently_preserves_order(self, mock_get):
+        """Test that concurrent scraping keeps input order and counts every article."""
+        def fake_get(url, **kwargs):
+            response = MagicMock()
+            response.text = f"""
+            <div id="entry-content">
+                <p>Article body for {url} with enough words to pass the threshold check.</p>
+                <p>More content to ensure we have over 100 characters of text in total.</p>
+            </div>
+            """
+            return response
+        mock_get.side_effect = fake_get
+        
+        scraper = WebScraper(strategy=ScrapingStrategy.ENHANCED, delay=0, max_workers=4)
+        articles = [
+            Article(
+                title=f"Article {i}",
+                url=f"https://example.com/article-{i}",
+                published_date=datetime.now(timezone.utc),
+                source_feed=SourceFeed.FREIGHT_WAVES
+            )
+            for i in range(8)
+        ]
+        
+        try:
+            scraped = scraper.scrape_articles(articles)
+        finally:
+            scraper.close()
+        
+        self.assertEqual([a.url for a in scraped], [a.url for a in articles])
+        for article in scraped:
+            self.assertIn(article.url, article.content)
+        
+        stats = scraper.get_stats()
+        self.assertEqual(stats['total'], 8)
+        self.assertEqual(stats['success'], 8)
+    
+    @patch('content_pipeline.scrapers.scraper.random.uniform', return_value=1.5)
+    @patch('content_pipeline.scrapers.scraper.time')
+    def test_concurrent_requests_are_paced_per_host(self, mock_time, mock_uniform):
+        """Test that request starts to one host are spaced while other hosts aren't."""
+        mock_time.monotonic.return_value = 100.0
+        scraper = WebScraper(strategy=ScrapingStrategy.ENHANCED, delay=1.0, max_workers=4)
+        
+        try:
+            scraper._wait_for_host("https://www.freightwaves.com/news/a")
+            scraper._wait_for_host("https://www.freightwaves.com/news/b")
+            scraper._wait_for_host("https://www.freightcaviar.com/c")
+            scraper._wait_for_host("https://www.freightwaves.com/news/d")
+        finally:
+            scraper.close()
+        
+        # First request to each host starts immediately; later ones wait their slot
+        sleeps = [c.args[0] for c in mock_time.sleep.call_args_list]
+        self.assertEqual(sleeps, [1.5, 3.0])
+        mock_uniform.assert_called_with(1.0, 2.0)
+    
+    def test_extract_content_skips_head(self):
+        """Test that only the body is parsed when the page has one."""
+        paragraph = "<p>Freight volumes rose again this week as shippers moved goods ahead of the holiday season.</p>"
+        html = f"""
+        <html>
+        <head>
+            <title>Freight Volumes Rise</title>
+            <script>var tracking = "Tracking script that must not appear in content";</script>
+        </head>
+        <body>
+            <article class="post">{paragraph * 3}</article>
+        </body>
+        </html>
+        """
+        
+        content, confidence = self.scraper._extract_content(html)
+        
+        self.assertIn("Freight volumes rose again", content)
+        self.assertNotIn("Tracking script", content)
+        self.assertGreater(confidence, 0.0)
+    
+    def test_extract_content_without_body_tag(self):
+        """Test that HTML fragments without a body tag are still parsed."""
+        paragraph = "<p>Freight volumes rose again this week as shippers moved goods ahead of the holiday season.</p>"
+        html = f'<div class="entry-content">{paragraph * 3}</div>'
+        
+        content, confidence = self.scraper._extract_content(html)
+        
+        self.assertIn("Freight volumes rose again", content)
+        self.assertGreater(confidence, 0.0)
+    
     def test_enhanced_content_selectors_order(self):
         """Test that selectors are tried in the correct order (most specific first)."""
         selectors = self.scraper.CONTENT_SELECTORS
@@ -11,6 +11,7 @@ This script validates:
 
 import sys
 import unittest
+from dataclasses import fields
 from datetime import datetime
 from pathlib import Path
 
@@ -21,7 +22,7 @@ from src.content_pipeline.core.models import (
     Article, ContentIdea, SummaryReport,
     SourceFeed, ScrapingStrategy, ContentType,
     Priority, ContentStatus,
-    validate_url, sanitize_text
+    validate_url, sanitize_text, pipeline_run
 )
 
 
@@ -40,6 +41,12 @@ class TestDataValidation(unittest.TestCase):
         self.assertFalse(validate_url("example.com"))  # Missing scheme
         self.assertFalse(validate_url(""))
         self.assertFalse(validate_url("http://"))  # Missing netloc
+        
+        # Hosts outside the plain ASCII fast path still go through urlparse
+        self.assertTrue(validate_url("http://[::1]:8080/path"))
+        self.assertTrue(validate_url("https://bücher.example/"))
+        self.assertFalse(validate_url("http://[::1/path"))  # Unbalanced IPv6 bracket
+        self.assertFalse(validate_url("http:///path"))
     
     def test_text_sanitization(self):
         """Test text sanitization."""
@@ -109,6 +116,46 @@ class TestArticleModel(unittest.TestCase):
             Article(**data)
         self.assertIn("Title cannot be empty", str(context.exception))
     
+    def test_article_coerces_enum_strings(self):
+        """Test that enum fields given as plain strings become members."""
+        data = self.valid_article_data.copy()
+        data["source_feed"] = "FreightCaviar"
+        data["scraping_strategy"] = "enhanced"
+        
+        article = Article(**data)
+        self.assertIs(article.source_feed, SourceFeed.FREIGHT_CAVIAR)
+        self.assertIs(article.scraping_strategy, ScrapingStrategy.ENHANCED)
+        self.assertEqual(article.to_dict()["source_feed"], "FreightCaviar")
+        
+        data["source_feed"] = "Unknown Feed"
+        with self.assertRaises(ValueError):
+            Article(**data)
+    
+    def test_pipeline_run_shares_timestamp(self):
+        """Test that models created inside a run share the run timestamp."""
+        run_start = datetime(2024, 1, 15, 9, 0, 0)
+        
+        with pipeline_run(run_start) as now:
+            first = Article(**self.valid_article_data)
+            second = Article(**self.valid_article_data)
+            idea = ContentIdea(idea_title="Test Idea", content_type=ContentType.BLOG_POST)
+        
+        self.assertEqual(now, run_start)
+        for created in (first.created_at, first.updated_at, second.created_at, idea.created_at):
+            self.assertEqual(created, run_start)
+        
+        # Outside a run the wall clock is used again
+        self.assertNotEqual(Article(**self.valid_article_data).created_at, run_start)
+    
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_article_uses_slots(self):
+        """Test that articles carry no per-instance __dict__."""
+        article = Article(**self.valid_article_data)
+        
+        self.assertFalse(hasattr(article, "__dict__"))
+        with self.assertRaises(AttributeError):
+            article.unknown_field = "value"
+    
     def test_article_backward_compatibility(self):
         """Test backward compatibility properties."""
         article = Article(**self.valid_article_data)
@@ -197,6 +244,20 @@ class TestContentIdeaModel(unittest.TestCase):
             ContentIdea(**data)
         self.assertIn("Idea title cannot be empty", str(context.exception))
     
+    def test_idea_coerces_enum_strings(self):
+        """Test that enum fields given as plain strings become members."""
+        idea = ContentIdea(
+            idea_title="Test Idea",
+            content_type="video",
+            priority="high",
+            status="on_hold"
+        )
+        
+        self.assertIs(idea.content_type, ContentType.VIDEO)
+        self.assertIs(idea.priority, Priority.HIGH)
+        self.assertIs(idea.status, ContentStatus.ON_HOLD)
+        self.assertEqual(idea.to_sheet_row()[4], "video")
+    
     def test_idea_backward_compatibility(self):
         """Test backward compatibility properties."""
         idea = ContentIdea(**self.valid_idea_data)
@@ -286,6 +347,44 @@ class TestSummaryReportModel(unittest.TestCase):
         self.assertEqual(row[5], 10)  # Ideas generated
 
 
+class TestSheetHeaders(unittest.TestCase):
+    """Test standardized sheet headers."""
+    
+    def test_headers_match_row_width(self):
+        """Test that each model's headers line up with its sheet rows."""
+        article = Article(
+            url="https://example.com/article",
+            title="Test Article",
+            published_date=datetime.now(),
+            source_feed=SourceFeed.FREIGHT_WAVES
+        )
+        idea = ContentIdea(idea_title="Test Content Idea", content_type=ContentType.BLOG_POST)
+        report = SummaryReport(
+            run_date=datetime.now(),
+            total_articles_fetched=100,
+            articles_scraped_successfully=85,
+            ideas_generated=10
+        )
+        
+        self.assertEqual(len(Article.sheet_headers()), len(article.to_sheet_row()))
+        self.assertEqual(len(ContentIdea.sheet_headers()), len(idea.to_sheet_row()))
+        self.assertEqual(len(SummaryReport.sheet_headers()), len(report.to_sheet_row()))
+    
+    def test_headers_are_copies(self):
+        """Test that mutating returned headers doesn't affect later calls."""
+        headers = Article.sheet_headers()
+        headers.append("Extra")
+        
+        self.assertNotIn("Extra", Article.sheet_headers())
+        self.assertEqual(Article.sheet_headers()[0], "ID")
+    
+    def test_sheet_headers_class_attribute(self):
+        """Test that SHEET_HEADERS mirrors sheet_headers() without being a field."""
+        for model in (Article, ContentIdea, SummaryReport):
+            self.assertEqual(list(model.SHEET_HEADERS), model.sheet_headers())
+            self.assertNotIn("SHEET_HEADERS", {f.name for f in fields(model)})
+
+
 class TestEnumerations(unittest.TestCase):
     """Test enumeration values."""
     